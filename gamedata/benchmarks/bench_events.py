@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""Measure Level0.process_event throughput under a JOYAXISMOTION flood"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+# pylint: disable=import-error wrong-import-position
+from invaders import parse_game_settings
+from invaderclone.fake_joystick import plug_in
+
+
+EVENTS = 20000
+
+
+def main():
+    """flood a two player Level0 with axis motion and report events/s"""
+
+    pygame.init()
+
+    game_settings = parse_game_settings(["--starting_lives", "1000", "--seed", "0"])
+    screen = pygame.display.set_mode((game_settings["width"], game_settings["height"]))
+
+    # pylint: disable=import-outside-toplevel
+    from invaderclone.level0 import Level0
+
+    level = Level0(screen, game_settings)
+
+    joysticks = plug_in(2)
+    level.process_event(pygame.event.Event(pygame.JOYDEVICEADDED, device_index=1))
+
+    rng = random.Random(0)
+    values = [rng.uniform(-1., 1.) for _ in range(EVENTS)]
+    events = [
+        pygame.event.Event(
+            pygame.JOYAXISMOTION,
+            instance_id=num % 2,
+            joy=num % 2,
+            axis=0,
+            value=value
+            )
+        for num, value in enumerate(values)
+        ]
+
+    start = time.perf_counter()
+    for event, value in zip(events, values):
+        joysticks[event.instance_id].axis = value
+        level.process_event(event)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{EVENTS} JOYAXISMOTION events: "
+        f"{EVENTS / elapsed:12.0f} events/s, "
+        f"{elapsed * 1e6 / EVENTS:8.2f} us/event"
+        )
+
+
+if __name__ == "__main__":
+    main()
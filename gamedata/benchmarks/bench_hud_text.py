@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""Time the HUD score text against rendering it on every change
+
+A frame here is some score changes followed by drawing the score, the
+way Level0 updates and draws its HUD.
+"""
+
+import os
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+# pylint: disable=import-error wrong-import-position
+from invaderclone import font_registry
+from invaderclone import theme
+from invaderclone.hud_text import NumberText, get_atlas
+
+
+FRAMES = 5000
+REPEAT = 7
+
+# score changes as they come in play: kills, penalties and the odd 1up
+STEPS = [50, 100, 50, -10, 150, 50, 100, -10]
+
+
+def scores(count):
+    """get count scores, changing the way they do in play"""
+
+    score = 0
+    values = []
+    for num in range(count):
+        score = max(0, score + STEPS[num % len(STEPS)])
+        values.append(score)
+
+    return values
+
+
+def best_us(function):
+    """get the best time of REPEAT runs of function, in us per frame"""
+
+    return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1e6 / FRAMES
+
+
+def main():
+    """time both ways of keeping the score text up to date"""
+
+    pygame.init()
+    canvas = pygame.display.set_mode((640, 480))
+
+    # pylint: disable=import-outside-toplevel
+    from invaderclone.level0 import Level0
+
+    font = font_registry.get(*Level0.font_requests(theme.Theme("default"), canvas.get_height())["score"])
+    color = (255, 255, 255)
+
+    atlas = get_atlas(font, color)
+    print(f"atlas lays the score out like Font.render: {NumberText(atlas, 'Score: ')._exact}")
+
+    for changes in (0, 1, 4):
+        values = scores(FRAMES * max(1, changes))
+        frames = [values[num * changes:(num + 1) * changes] for num in range(FRAMES)]
+        text = NumberText(atlas, "Score: ", values[-1])
+        rendered = [font.render(f"Score: {values[-1]}", True, color)]
+
+        def number_text_frames(text=text, frames=frames):
+            for frame in frames:
+                for value in frame:
+                    text.value = value
+                text.draw(canvas, (4, 4))
+
+        def render_frames(rendered=rendered, frames=frames):
+            for frame in frames:
+                for value in frame:
+                    rendered[0] = font.render(f"Score: {value}", True, color)
+                canvas.blit(rendered[0], (4, 4))
+
+        print(
+            f"{changes} score changes/frame: "
+            f"NumberText {best_us(number_text_frames):6.2f} us/frame, "
+            f"render on change {best_us(render_frames):6.2f} us/frame"
+            )
+
+
+if __name__ == "__main__":
+    main()
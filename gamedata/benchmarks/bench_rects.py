@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Count pygame.Rect allocations and time Level0.update_scene per frame"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+# pylint: disable=import-error wrong-import-position
+from invaders import parse_game_settings
+
+
+class CountingRect(pygame.Rect):
+    """a Rect that counts how many times it is constructed"""
+
+    count = 0
+
+    def __init__(self, *args):
+        CountingRect.count += 1
+        super().__init__(*args)
+
+
+SCENARIOS = [
+    ("12x4", ["--columns", "12", "--rows", "4"]),
+    ("30x10", ["--columns", "30", "--rows", "10", "--width", "3400", "--height", "1000"]),
+    ]
+
+FRAMES = 600
+
+
+def run_scenario(name, argv):
+    """play a scenario for FRAMES frames, returning rects and ms per frame"""
+
+    game_settings = parse_game_settings(argv + ["--starting_lives", "1000", "--seed", "0"])
+    screen = pygame.display.set_mode((game_settings["width"], game_settings["height"]))
+
+    # pylint: disable=import-outside-toplevel
+    from invaderclone.level0 import Level0
+
+    level = Level0(screen, game_settings)
+    num_enemies = level.entity_counts()["enemies"]
+
+    CountingRect.count = 0
+    elapsed = 0.
+    frames = 0
+
+    for frame in range(FRAMES):
+        if not level.is_valid():
+            break
+        if frame % 5 == 0:
+            for event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                level.process_event(pygame.event.Event(
+                    event_type, key=pygame.K_SPACE, mod=0, unicode="", scancode=0
+                    ))
+
+        start = time.perf_counter()
+        level.tick()
+        level.update_scene()
+        elapsed += time.perf_counter() - start
+        frames += 1
+
+    print(
+        f"{name:>6}: {num_enemies:4d} enemies, "
+        f"{CountingRect.count / frames:8.1f} rects/frame, "
+        f"{elapsed * 1000 / frames:7.3f} ms/frame update_scene"
+        )
+
+
+def main():
+    """run every scenario"""
+
+    pygame.init()
+    pygame.Rect = CountingRect
+
+    for name, argv in SCENARIOS:
+        run_scenario(name, argv)
+
+
+if __name__ == "__main__":
+    main()
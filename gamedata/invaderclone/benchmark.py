@@ -0,0 +1,299 @@
+"""Time Level0 under scripted scenarios and compare runs
+
+    invaderclone-bench --output baseline.json
+    invaderclone-bench --baseline baseline.json --threshold 1.1
+
+Each scenario builds a Level0, plays it with scripted input events for a
+number of frames, and reports the time spent in update_scene and draw
+and in each of their phases. The results are written as JSON. Given a
+baseline written by an earlier run, the two are compared and the exit
+status is 1 if any time grew by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+# pylint: disable=wrong-import-position
+from .fake_joystick import plug_in
+from .phase_timer import PhaseTimer
+
+
+FORMAT_VERSION = 1
+
+DEFAULT_FRAMES = 300
+WARMUP_FRAMES = 10
+
+
+def _top_up_bullets(level, rng, count):
+    """keep count bullets falling from the top of the screen"""
+
+    width, height = pygame.display.get_surface().get_size()
+    for _ in range(count - level.entity_counts()["bullets"]):
+        level.spawn_enemy_bullet(
+            (rng.randint(0, width), rng.randint(0, height // 2)),
+            rng.uniform(1., 3.)
+            )
+
+
+def _top_up_obstacles(level, _rng, count):
+    """keep count obstacles falling down the screen"""
+
+    for _ in range(count - level.entity_counts()["obstacles"]):
+        level.spawn_obstacle()
+
+
+def _add_second_player(level):
+    """plug in two pretend gamepads so player 2 joins"""
+
+    plug_in(2)
+    level.process_event(pygame.event.Event(pygame.JOYDEVICEADDED, device_index=1))
+
+
+# name: (command line arguments, setup(level), script(level, rng, frame))
+SCENARIOS = {
+    "default": (
+        [],
+        None,
+        None,
+        ),
+    "max_grid": (
+        ["--columns", "30", "--rows", "10", "--width", "3400", "--height", "1000"],
+        None,
+        None,
+        ),
+    "bullets_500": (
+        [],
+        None,
+        lambda level, rng, frame: _top_up_bullets(level, rng, 500),
+        ),
+    "obstacles_50": (
+        ["--obstacle_chance", "0"],
+        None,
+        lambda level, rng, frame: _top_up_obstacles(level, rng, 50),
+        ),
+    "two_players": (
+        [],
+        _add_second_player,
+        None,
+        ),
+    }
+
+
+def _key(level, event_type, key):
+    level.process_event(pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0))
+
+
+def _move_and_shoot(level, frame):
+    """the scripted input every scenario gets: sway and fire
+
+    Player 1 uses the keyboard. Player 2, when a second gamepad is
+    plugged in, uses gamepad 1 half a sway behind.
+    """
+
+    if frame % 60 == 0:
+        _key(level, pygame.KEYDOWN, pygame.K_RIGHT)
+    elif frame % 60 == 15:
+        _key(level, pygame.KEYDOWN, pygame.K_LEFT)
+    if frame % 10 == 0:
+        _key(level, pygame.KEYDOWN, pygame.K_SPACE)
+        _key(level, pygame.KEYUP, pygame.K_SPACE)
+
+    if pygame.joystick.get_count() > 1:
+        if frame % 60 in (30, 45):
+            value = 1. if frame % 60 == 30 else -1.
+            level.process_event(pygame.event.Event(
+                pygame.JOYAXISMOTION, instance_id=1, joy=1, axis=0, value=value
+                ))
+        if frame % 10 == 5:
+            level.process_event(pygame.event.Event(
+                pygame.JOYBUTTONDOWN, instance_id=1, joy=1, button=0
+                ))
+
+
+def _summary(samples):
+    """summarize seconds per frame as milliseconds"""
+
+    if not samples:
+        return {"mean_ms": 0., "p95_ms": 0., "max_ms": 0.}
+
+    ordered = sorted(samples)
+
+    return {
+        "mean_ms": sum(ordered) * 1000 / len(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        }
+
+
+def run_scenario(name, frames, seed=0):
+    """play a scenario and return its timings"""
+
+    # pylint: disable=import-outside-toplevel
+    from invaders import parse_game_settings
+    from .level0 import Level0
+
+    argv, setup, script = SCENARIOS[name]
+
+    game_settings = parse_game_settings(argv + ["--starting_lives", "1000000", "--seed", str(seed)])
+    screen = pygame.display.set_mode((game_settings["width"], game_settings["height"]))
+
+    # start every scenario with no gamepads, real or from an earlier one
+    plug_in(0)
+    rng = random.Random(seed)
+    level = Level0(screen, game_settings)
+    if setup is not None:
+        setup(level)
+
+    timer = PhaseTimer()
+    samples = {"update_scene": [], "draw": []}
+    phase_samples = {}
+    played = 0
+
+    for frame in range(WARMUP_FRAMES + frames):
+        if not level.is_valid():
+            break
+
+        _move_and_shoot(level, frame)
+        if script is not None:
+            script(level, rng, frame)
+
+        level.set_phase_timer(timer if frame >= WARMUP_FRAMES else None)
+
+        start = time.perf_counter()
+        level.tick()
+        level.update_scene()
+        updated = time.perf_counter()
+        level.draw()
+        drawn = time.perf_counter()
+
+        if frame < WARMUP_FRAMES:
+            continue
+
+        timer.end_frame()
+        samples["update_scene"].append(updated - start)
+        samples["draw"].append(drawn - updated)
+        for phase, elapsed in timer.last_frame.items():
+            phase_samples.setdefault(phase, []).append(elapsed)
+        played += 1
+
+    return {
+        "frames": played,
+        **level.entity_counts(),
+        "update_scene": _summary(samples["update_scene"]),
+        "draw": _summary(samples["draw"]),
+        "phases": {
+            phase: _summary(elapsed + [0.] * (played - len(elapsed)))
+            for phase, elapsed in sorted(phase_samples.items())
+            },
+        }
+
+
+def run(names, frames, seed=0):
+    """run scenarios and return a report"""
+
+    pygame.init()
+
+    return {
+        "format": FORMAT_VERSION,
+        "frames": frames,
+        "seed": seed,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "scenarios": {name: run_scenario(name, frames, seed) for name in names},
+        }
+
+
+def _timings(result):
+    """flatten a scenario result to {timing name: mean ms}"""
+
+    timings = {
+        "update_scene": result["update_scene"]["mean_ms"],
+        "draw": result["draw"]["mean_ms"],
+        }
+    for phase, summary in result["phases"].items():
+        timings[f"  {phase}"] = summary["mean_ms"]
+
+    return timings
+
+
+def compare(report, baseline, threshold):
+    """print report against baseline, returning the timings that regressed"""
+
+    regressions = []
+
+    for name, result in report["scenarios"].items():
+        base_result = baseline.get("scenarios", {}).get(name)
+        print(f"{name} ({result['frames']} frames)")
+        if base_result is None:
+            print("  not in baseline")
+            continue
+
+        base_timings = _timings(base_result)
+        for timing, mean in _timings(result).items():
+            base_mean = base_timings.get(timing)
+            if not base_mean:
+                print(f"  {timing:<20} {mean:8.3f} ms")
+                continue
+
+            ratio = mean / base_mean
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSED"
+                regressions.append((name, timing.strip()))
+            print(f"  {timing:<20} {mean:8.3f} ms  (baseline {base_mean:8.3f} ms, x{ratio:.2f}){flag}")
+
+    return regressions
+
+
+def main(argv=None):
+    """run the benchmark from the command line"""
+
+    parser = argparse.ArgumentParser(
+        prog="invaderclone-bench",
+        description="Time Level0's update_scene and draw under scripted scenarios."
+        )
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO", help=f"scenarios to run (default all: {', '.join(SCENARIOS)})")
+    parser.add_argument("-f", "--frames", type=int, default=DEFAULT_FRAMES, help="frames to time per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for every scenario")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("-b", "--baseline", help="compare against a JSON report from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.1, help="slowdown ratio that counts as a regression (default 1.1)")
+
+    args = parser.parse_args(argv)
+
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+
+    report = run(args.scenarios or list(SCENARIOS), args.frames, args.seed)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    elif not args.baseline:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(report, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Keeps every bullet of a level in one set of numpy arrays"""
+
+import numpy
+import pygame
+
+from . import bullets
+from . import rgbcolors
+
+
+# pylint: disable=too-many-instance-attributes
+class BulletStore:
+    """struct-of-arrays bullet storage that moves every bullet at once"""
+
+    KINDS = (
+        bullets.PlayerBullet,
+        bullets.PlayerBulletOneThird,
+        bullets.EnemyBullet,
+        )
+
+    def __init__(self, capacity=64):
+        """initialize an empty bullet store"""
+
+        capacity = max(1, capacity)
+
+        self._kind_index = {kind: num for num, kind in enumerate(self.KINDS)}
+        self._count = 0
+
+        self._positions = numpy.zeros((capacity, 2))
+        self._previous = numpy.zeros((capacity, 2))
+        self._targets = numpy.zeros((capacity, 2))
+        self._speeds = numpy.zeros(capacity)
+        self._sizes = numpy.zeros((capacity, 2), dtype=numpy.int64)
+        self._kinds = numpy.zeros(capacity, dtype=numpy.int8)
+        self._alive = numpy.zeros(capacity, dtype=bool)
+        self._images = numpy.full(capacity, None, dtype=object)
+
+        self._rects = [pygame.Rect(0, 0, 0, 0) for _ in range(capacity)]
+        self._rect_rows = []
+        self._dying = []
+
+        self._allocated = capacity
+        self._spawned = 0
+        self._recycled = 0
+        self._high_water = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        """get the number of bullets the arrays can hold before growing"""
+
+        return len(self._speeds)
+
+    @property
+    def allocated(self):
+        """get the number of bullet slots ever allocated"""
+
+        return self._allocated
+
+    @property
+    def spawned(self):
+        """get the number of bullets ever spawned"""
+
+        return self._spawned
+
+    @property
+    def recycled(self):
+        """get the number of bullets spawned into a previously used slot"""
+
+        return self._recycled
+
+    def _grow(self):
+        """double the size of every array"""
+
+        capacity = self.capacity * 2
+        self._allocated += capacity - self.capacity
+
+        def grown(array):
+            new_array = numpy.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self._count] = array[:self._count]
+            return new_array
+
+        self._positions = grown(self._positions)
+        self._previous = grown(self._previous)
+        self._targets = grown(self._targets)
+        self._speeds = grown(self._speeds)
+        self._sizes = grown(self._sizes)
+        self._kinds = grown(self._kinds)
+        self._alive = grown(self._alive)
+
+        images = numpy.full(capacity, None, dtype=object)
+        images[:self._count] = self._images[:self._count]
+        self._images = images
+
+        self._rects.extend(
+            pygame.Rect(0, 0, 0, 0) for _ in range(capacity - len(self._rects))
+            )
+
+    def spawn(self, kind, position, target_position, speed, bulletimg=None):
+        """add a bullet of a kind from KINDS to the store"""
+
+        if self._count == self.capacity:
+            self._grow()
+
+        num = self._count
+        self._positions[num] = (position[0], position[1])
+        self._previous[num] = self._positions[num]
+        self._targets[num] = (target_position[0], target_position[1])
+        self._speeds[num] = speed
+        self._kinds[num] = self._kind_index[kind]
+        self._alive[num] = True
+
+        if bulletimg is not None:
+            self._sizes[num] = bulletimg.get_size()
+        else:
+            self._sizes[num] = (4, 8)
+
+        self._images[num] = bulletimg
+        self._count += 1
+        self._spawned += 1
+
+        if num < self._high_water:
+            self._recycled += 1
+        else:
+            self._high_water = self._count
+
+        return num
+
+    def update(self):
+        """move every bullet towards its target and find which arrived"""
+
+        count = self._count
+        positions = self._positions[:count]
+        targets = self._targets[:count]
+        speeds = self._speeds[:count]
+        self._previous[:count] = positions
+
+        delta = targets - positions
+        distance_sq = numpy.einsum("ij,ij->i", delta, delta)
+        arrived = distance_sq <= speeds * speeds
+        moving = ~arrived & (distance_sq > 0.)
+
+        distance = numpy.sqrt(distance_sq[moving])
+        positions[moving] += delta[moving] * (speeds[moving] / distance)[:, None]
+        positions[arrived] = targets[arrived]
+
+        self._dying = numpy.all(positions == targets, axis=1).tolist()
+        self._rect_rows = numpy.concatenate(
+            (positions.astype(numpy.int64), self._sizes[:count]), axis=1
+            ).tolist()
+
+    def kind(self, num):
+        """get the bullet class of a bullet"""
+
+        return self.KINDS[self._kinds[num]]
+
+    def rect(self, num):
+        """get the bounding rect of a bullet as of the last update
+
+        The rect belongs to the slot and is updated in place, so it is only
+        valid until the next update or cull.
+        """
+
+        rect = self._rects[num]
+        rect.update(self._rect_rows[num])
+
+        return rect
+
+    def should_die(self, num):
+        """determine if a bullet reached its target in the last update"""
+
+        return self._dying[num]
+
+    def is_alive(self, num):
+        """determine if a bullet has not been killed"""
+
+        return bool(self._alive[num])
+
+    def kill(self, num):
+        """mark a bullet for removal at the next cull"""
+
+        self._alive[num] = False
+
+    def cull(self):
+        """drop every killed bullet, keeping the rest in spawn order"""
+
+        count = self._count
+        alive = self._alive[:count]
+        remaining = int(numpy.count_nonzero(alive))
+        if remaining == count:
+            return
+
+        self._positions[:remaining] = self._positions[:count][alive]
+        self._previous[:remaining] = self._previous[:count][alive]
+        self._targets[:remaining] = self._targets[:count][alive]
+        self._speeds[:remaining] = self._speeds[:count][alive]
+        self._sizes[:remaining] = self._sizes[:count][alive]
+        self._kinds[:remaining] = self._kinds[:count][alive]
+        self._images[:remaining] = self._images[:count][alive]
+        self._images[remaining:count] = None
+        self._alive[:remaining] = True
+        self._alive[remaining:count] = False
+        self._count = remaining
+
+    def clear(self):
+        """remove every bullet"""
+
+        self._alive[:self._count] = False
+        self._images[:self._count] = None
+        self._count = 0
+
+    def draw(self, screen, alpha=1.):
+        """draw every bullet, alpha of the way from its last position"""
+
+        count = self._count
+        positions = self._positions[:count]
+        if alpha < 1.:
+            previous = self._previous[:count]
+            positions = previous + (positions - previous) * alpha
+        positions = positions.tolist()
+        images = self._images[:count].tolist()
+        screen.blits(
+            [
+                (img, pos)
+                for img, pos in zip(images, positions)
+                if img is not None
+                ],
+            doreturn=False
+            )
+
+        if None in images:
+            for num, img in enumerate(images):
+                if img is None:
+                    screen.fill(
+                        rgbcolors.ghostwhite,
+                        pygame.Rect(positions[num], self._sizes[num].tolist())
+                        )
@@ -9,11 +9,32 @@ from . import rgbcolors
 class Bullet:
     """Implement a generic bullet"""
 
+    __slots__ = (
+        "_position",
+        "_previous",
+        "_target_position",
+        "_speed",
+        "_img",
+        "_width",
+        "_height",
+        "_rect",
+        )
+
     def __init__(self, position, target_position, speed, bulletimg=None):
         """Initialize a bullet"""
 
-        self._position = pygame.math.Vector2(position)
-        self._target_position = pygame.math.Vector2(target_position)
+        self._position = pygame.math.Vector2()
+        self._previous = pygame.math.Vector2()
+        self._target_position = pygame.math.Vector2()
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        Bullet.reset(self, position, target_position, speed, bulletimg)
+
+    def reset(self, position, target_position, speed, bulletimg=None):
+        """reinitialize a bullet in place so it can be reused"""
+
+        self._position.update(position)
+        self._previous.update(position)
+        self._target_position.update(target_position)
         self._speed = speed
         if bulletimg is not None:
             self._img = bulletimg
@@ -24,41 +45,56 @@ class Bullet:
             self._width = 4
             self._height = 8
 
+        self._rect.update(
+            int(self._position.x),
+            int(self._position.y),
+            self._width,
+            self._height
+            )
+
     def should_die(self):
         """determine if a bullet should die"""
 
-        squared_distance = (
-            self._position - self._target_position
-            ).length_squared()
+        squared_distance = self._position.distance_squared_to(
+            self._target_position)
         return math.isclose(squared_distance, 0.0, rel_tol=1e-01)
 
-    def draw(self, screen):
-        """draw an enemy bullet"""
+    def draw(self, screen, alpha=1.):
+        """draw an enemy bullet, alpha of the way from its last position"""
 
         if self._img is not None:
-            screen.blit(self._img, self._position)
+            screen.blit(self._img, self.draw_position(alpha))
         else:
-            pygame.draw.rect(screen, rgbcolors.ghostwhite, self.rect)
+            screen.fill(rgbcolors.ghostwhite, self.rect)
+
+    def draw_position(self, alpha=1.):
+        """get where to draw, alpha of the way from the last position"""
+
+        if alpha >= 1.:
+            return self._position
+
+        return self._previous.lerp(self._position, alpha)
 
     @property
     def rect(self):
-        """bounding rect"""
+        """bounding rect, updated in place as the bullet moves"""
 
-        left = self._position.x
-        top = self._position.y
-        width = self._width
-        height = self._height
-        return pygame.Rect(left, top, width, height)
+        return self._rect
 
     def update(self):
         """update the position of a bullet"""
 
+        self._previous.update(self._position)
         self._position.move_towards_ip(self._target_position, self._speed)
+        self._rect.x = int(self._position.x)
+        self._rect.y = int(self._position.y)
 
 
 class PlayerBullet(Bullet):
     """Implements a player's bullet"""
 
+    __slots__ = ()
+
     def __init__self(self, position, target_position, speed, bulletimg=None):
         super.__init__(self, position, target_position, speed, bulletimg)
 
@@ -66,6 +102,8 @@ class PlayerBullet(Bullet):
 class PlayerBulletOneThird(Bullet):
     """implements a player bullet that costs 1/3rd the price when lost"""
 
+    __slots__ = ()
+
     def __init__self(self, position, target_position, speed, bulletimg=None):
         super.__init__(self, position, target_position, speed, bulletimg)
 
@@ -73,6 +111,8 @@ class PlayerBulletOneThird(Bullet):
 class EnemyBullet(Bullet):
     """implement an enemy bullet"""
 
+    __slots__ = ()
+
     def __init__self(self, position, target_position, speed, bulletimg=None):
         super.__init__(self, position, target_position, speed, bulletimg)
 
@@ -7,6 +7,8 @@ from .bullets import Bullet
 class BurstShotPowerup(Bullet):
     """Shoot a burst of bullets"""
 
+    __slots__ = ("_maxtime",)
+
     def __init__(self, position, target_position, speed, img, maxtime=3):
         """initialize an instance of the burst shot powerup"""
 
@@ -14,6 +16,13 @@ class BurstShotPowerup(Bullet):
 
         self._maxtime = maxtime
 
+    def reset(self, position, target_position, speed, img, maxtime=3):
+        """reinitialize the powerup in place so it can be reused"""
+
+        super().reset(position, target_position, speed, img)
+
+        self._maxtime = maxtime
+
     @property
     def maxtime(self):
         """get the max time of a power up"""
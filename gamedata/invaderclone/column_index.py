@@ -0,0 +1,53 @@
+"""Keeps track of which enemy is at the front of each column"""
+
+
+class ColumnIndex:
+    """an index of the living enemies in each column of a formation"""
+
+    def __init__(self):
+        """initialize an empty column index"""
+
+        self._columns = {}
+        self._column_of = {}
+        self._front_line = None
+
+    def __len__(self):
+        return len(self._column_of)
+
+    def add(self, column, enemy):
+        """add an enemy to the bottom of a column"""
+
+        self._columns.setdefault(column, []).append(enemy)
+        self._column_of[enemy] = column
+        self._front_line = None
+
+    def remove(self, enemy):
+        """remove an enemy from its column if it is indexed"""
+
+        column = self._column_of.pop(enemy, None)
+        if column is None:
+            return
+
+        enemies = self._columns[column]
+        enemies.remove(enemy)
+        if not enemies:
+            del self._columns[column]
+        self._front_line = None
+
+    def clear(self):
+        """remove every enemy from the index"""
+
+        self._columns.clear()
+        self._column_of.clear()
+        self._front_line = None
+
+    def front_line(self):
+        """get the lowest living enemy of every column, left to right"""
+
+        if self._front_line is None:
+            self._front_line = [
+                self._columns[column][-1]
+                for column in sorted(self._columns)
+                ]
+
+        return self._front_line
@@ -0,0 +1,72 @@
+"""Draws to the screen while remembering which regions changed"""
+
+
+class DirtyRectRenderer:
+    """a stand-in for the screen surface that records every blit
+
+    Drawing code is handed the renderer instead of the screen. begin
+    erases what was drawn last frame by copying the background back over
+    it, and end returns last frame's rects plus this frame's rects, which
+    is everything pygame.display.update has to copy. After invalidate,
+    the next frame is a full redraw and end returns None.
+    """
+
+    def __init__(self, screen):
+        """initialize a renderer for a screen"""
+
+        self._screen = screen
+        self._previous = []
+        self._current = []
+        self._full = True
+
+    def __getattr__(self, name):
+        return getattr(self._screen, name)
+
+    def invalidate(self):
+        """make the next frame a full redraw"""
+
+        self._full = True
+
+    def begin(self, background):
+        """erase last frame's drawings, or the whole screen if invalidated"""
+
+        if self._full:
+            self._screen.blit(background, (0, 0))
+        else:
+            for rect in self._previous:
+                self._screen.blit(background, rect, rect)
+
+        self._current.clear()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """blit to the screen and remember where"""
+
+        rect = self._screen.blit(source, dest, area, special_flags)
+        self._current.append(rect)
+
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        """blit many surfaces to the screen and remember where"""
+
+        rects = self._screen.blits(blit_sequence, doreturn=True)
+        self._current.extend(rects)
+
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        """fill part of the screen and remember where"""
+
+        rect = self._screen.fill(color, rect, special_flags)
+        self._current.append(rect)
+
+        return rect
+
+    def end(self):
+        """get the rects that changed this frame, or None for everything"""
+
+        rects = None if self._full else self._previous + self._current
+        self._full = False
+        self._previous, self._current = self._current, self._previous
+
+        return rects
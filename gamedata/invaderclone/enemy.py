@@ -8,11 +8,17 @@ class EnemyShip:
     def __init__(self, position, screen, sprite, speed=5):
         """initialize an enemy ship"""
 
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._below_rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(position, screen, sprite, speed)
+
+    def reset(self, position, screen, sprite, speed=5):
+        """reinitialize the ship in place so it can be reused"""
+
         self._screen = screen
         self._position = position
         self._width, self._height = screen.get_size()
         self._character_width = sprite.get_width()
-        width = (self._character_width, self._character_width)
         self._is_exploding = False
         self._sprite = sprite
         self._velocity = pygame.math.Vector2(0, 0)
@@ -21,13 +27,57 @@ class EnemyShip:
         self._stop = False
         self._speed = speed
 
+        self._rect.size = (self._character_width, self._character_width)
+        self._below_rect.size = (self._character_width, self._width)
+        self._move_rects()
+
+        self._formation = None
+        self._formation_version = None
+        self._slot = None
+        self._slot_rect = None
+        self._slot_below_top = None
+
+    def join_formation(self, formation):
+        """make the current position this ship's slot in a formation"""
+
+        self._formation = formation
+        self._formation_version = None
+        self._slot = pygame.math.Vector2(self._position)
+        self._slot_rect = self._rect.copy()
+        self._slot_below_top = self._below_rect.y
+
+    def _sync_formation(self):
+        """move the cached rects along with the formation if it moved"""
+
+        version = self._formation.version
+        if version != self._formation_version:
+            o_x, o_y = self._formation.origin
+            self._rect.x = self._slot_rect.x + o_x
+            self._rect.y = self._slot_rect.y + o_y
+            self._below_rect.x = self._rect.x
+            self._below_rect.y = self._slot_below_top + o_y
+            self._formation_version = version
+
+    def _move_rects(self):
+        """move the cached rects to the current position"""
+
+        left = int(self._position.x)
+        self._rect.x = left
+        self._rect.y = int(self._position.y)
+        self._below_rect.x = left
+        self._below_rect.y = int(self._position.y + self._character_width)
+
     def update(self):
         """update an enemy ship"""
 
+        if self._formation is not None:
+            return
+
         t_x = self._target_pos.x
         t_y = self._target_pos.y
         if not self._stop and self._position.distance_to((t_x, t_y)):
             self._position.move_towards_ip(self._target_pos, self._speed)
+            self._move_rects()
 
     @property
     def speed(self):
@@ -63,25 +113,33 @@ class EnemyShip:
     def rect(self):
         """get the rect of the enemy ship"""
 
-        left = self._position.x  # - (self._width // 4)
-        top = self._position.y  # - (self._width // 4)
-        width = self._character_width
-        return pygame.Rect(left, top, width, width)
+        if self._formation is not None:
+            self._sync_formation()
+
+        return self._rect
+
+    @property
+    def slot_rect(self):
+        """get the rect of the ship relative to its formation"""
+
+        return self._slot_rect
 
     @property
     def below_rect(self):
         """rect that detects things below"""
 
-        left = self._position.x
-        top = self._position.y + self._character_width
-        width = self._character_width
-        height, _ = self._screen.get_size()
-        return pygame.Rect(left, top, width, height)
+        if self._formation is not None:
+            self._sync_formation()
+
+        return self._below_rect
 
     @property
     def position(self):
         """get the position of the enemy"""
 
+        if self._formation is not None:
+            return self._slot + self._formation.offset
+
         return self._position
 
     @position.setter
@@ -89,6 +147,7 @@ class EnemyShip:
         """set the position of the enemy"""
 
         self._position = val
+        self._move_rects()
 
     @property
     def original_position(self):
@@ -132,8 +191,11 @@ class EnemyShip:
 
         self._is_exploding = val
 
-    def draw(self, screen):
-        """draw the ship"""
+    def draw(self, screen, alpha=1.):
+        """draw the ship, alpha of the way from where its formation last was"""
 
-        screen.blit(self._sprite, self.position)
+        if self._formation is not None and alpha < 1.:
+            screen.blit(self._sprite, self._slot + self._formation.offset_at(alpha))
+        else:
+            screen.blit(self._sprite, self.position)
         # pygame.draw.rect(screen, rgbcolors.red, self.below_rect)
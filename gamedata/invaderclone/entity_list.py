@@ -0,0 +1,97 @@
+"""A list of entities that defers removal until the end of a frame"""
+
+
+class EntityList:
+    """entities are marked dead while iterating and dropped by compact
+
+    Killing an entity is O(1). Iteration skips entities that are dead and
+    only visits entities that were in the list when iteration began, so
+    entities can be killed or appended during a pass without skipping
+    anything. compact swap-removes every dead entity once per frame.
+    """
+
+    def __init__(self, entities=()):
+        """initialize an entity list"""
+
+        self._entities = []
+        self._alive = []
+        self._index = {}
+        self._num_dead = 0
+
+        for entity in entities:
+            self.append(entity)
+
+    def __len__(self):
+        return len(self._entities) - self._num_dead
+
+    def __bool__(self):
+        return len(self._entities) > self._num_dead
+
+    def __contains__(self, entity):
+        index = self._index.get(entity)
+
+        return index is not None and self._alive[index]
+
+    def __iter__(self):
+        entities = self._entities
+        alive = self._alive
+
+        for index in range(len(entities)):
+            if alive[index]:
+                yield entities[index]
+
+    def append(self, entity):
+        """add an entity to the end of the list"""
+
+        self._index[entity] = len(self._entities)
+        self._entities.append(entity)
+        self._alive.append(True)
+
+    def kill(self, entity):
+        """mark an entity dead, returning whether it was alive"""
+
+        index = self._index.get(entity)
+        if index is None or not self._alive[index]:
+            return False
+
+        self._alive[index] = False
+        self._num_dead += 1
+
+        return True
+
+    def compact(self):
+        """swap-remove every dead entity, returning the removed entities"""
+
+        removed = []
+        if not self._num_dead:
+            return removed
+
+        entities = self._entities
+        alive = self._alive
+        index = len(entities) - 1
+
+        while index >= 0:
+            if not alive[index]:
+                removed.append(entities[index])
+                del self._index[entities[index]]
+
+                last = len(entities) - 1
+                if index != last:
+                    entities[index] = entities[last]
+                    alive[index] = alive[last]
+                    self._index[entities[index]] = index
+                entities.pop()
+                alive.pop()
+            index -= 1
+
+        self._num_dead = 0
+
+        return removed
+
+    def clear(self):
+        """remove every entity"""
+
+        self._entities.clear()
+        self._alive.clear()
+        self._index.clear()
+        self._num_dead = 0
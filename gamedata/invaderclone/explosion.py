@@ -1,8 +1,31 @@
 """An explosion animation"""
 
+import weakref
+
 import pygame
 
 
+_FRAMES = weakref.WeakKeyDictionary()
+
+
+def explosion_frames(sprite, size):
+    """get the animation frames for a sprite at a size, building them once
+
+    The frames are shared by every explosion drawn with the same sprite
+    and size, and are dropped along with the sprite.
+    """
+
+    by_size = _FRAMES.setdefault(sprite, {})
+    frames = by_size.get(size)
+    if frames is None:
+        img = pygame.transform.scale(sprite, (size, size))
+        frames = (img.convert_alpha(),
+                  pygame.transform.flip(img, 1, 1).convert_alpha())
+        by_size[size] = frames
+
+    return frames
+
+
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-few-public-methods
 class Explosion:
@@ -12,17 +35,18 @@ class Explosion:
         """Initialize an Explosion"""
         self._defaultlife = 9
         self._animcycle = 3
-        img = pygame.transform.scale(sprite, (size, size))
-        self._images = []
-        if not self._images:
-            self._images = [img.convert_alpha(),
-                            pygame.transform.flip(img, 1, 1).convert_alpha()]
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(actor, sprite, size)
+
+    def reset(self, actor, sprite, size):
+        """Restart the explosion on another actor"""
+        self._images = explosion_frames(sprite, size)
 
-        anim_x, anim_y = actor.rect.center
         self._position = actor.position
 
         self.image = self._images[0]
-        self.rect = self.image.get_rect(center=(anim_x, anim_y))
+        self.rect.size = self.image.get_size()
+        self.rect.center = actor.rect.center
         self.life = self._defaultlife
         self._actor = actor
 
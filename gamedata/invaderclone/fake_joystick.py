@@ -0,0 +1,31 @@
+"""Pretend gamepads so the benchmarks run without hardware"""
+
+import pygame
+
+
+class FakeJoystick:
+    """stands in for a gamepad so the benchmarks run without hardware"""
+
+    def __init__(self, instance_id):
+        self._instance_id = instance_id
+        self.axis = 0.
+
+    def get_instance_id(self):
+        return self._instance_id
+
+    def get_axis(self, _axis):
+        return self.axis
+
+
+def plug_in(count):
+    """make pygame.joystick report count fake gamepads, returning them
+
+    Scenes find them the way they find real gamepads: when they are
+    created, and on a JOYDEVICEADDED event.
+    """
+
+    joysticks = [FakeJoystick(num) for num in range(count)]
+    pygame.joystick.get_count = lambda: len(joysticks)
+    pygame.joystick.Joystick = joysticks.__getitem__
+
+    return joysticks
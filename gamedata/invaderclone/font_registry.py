@@ -0,0 +1,134 @@
+"""A process-wide registry of opened fonts"""
+
+from collections import deque
+
+import pygame
+
+from . import theme_pack
+
+
+class FontRegistry:
+    """fonts keyed by (path, size), opened once and shared
+
+    Every scene asking for the same file at the same size gets the same
+    Font. Its style (set_bold, set_italic, set_underline and the like) is
+    seen by every caller, so callers must leave the style alone or set
+    it back after rendering. Paths are compared as given, the way
+    theme.Theme hands them out, since resolving them costs about as much
+    as opening a small font. The registry is not thread-safe, and fonts
+    are only ever opened on the main thread, since FreeType is not
+    thread-safe either.
+    """
+
+    def __init__(self):
+        """initialize an empty registry"""
+
+        self._fonts = {}
+        self._pending = deque()
+        self._hits = 0
+        self._misses = 0
+        self._preloaded = 0
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def get(self, filename, size):
+        """get the font at filename (a file or pack member) at size"""
+
+        key = (filename, size)
+
+        font = self._fonts.get(key)
+        if font is not None:
+            self._hits += 1
+            return font
+
+        self._misses += 1
+
+        font = self._fonts[key] = pygame.font.Font(theme_pack.resolve(filename), size)
+
+        return font
+
+    def preload(self, requests):
+        """queue the fonts for (filename, size) requests to be opened by load_pending
+
+        Nothing is opened here, so queueing costs nothing at startup. A
+        queued font asked for with get before its turn is opened then.
+        """
+
+        self._pending.extend(requests)
+
+    def load_pending(self, count=1):
+        """open up to count queued fonts that are not open yet, returning how many are left queued"""
+
+        pending = self._pending
+        while count > 0 and pending:
+            key = tuple(pending.popleft())
+            if key in self._fonts:
+                continue
+            self._fonts[key] = pygame.font.Font(theme_pack.resolve(key[0]), key[1])
+            self._preloaded += 1
+            count -= 1
+
+        return len(pending)
+
+    def forget(self, directory):
+        """forget the fonts opened, or queued, from files or pack members within directory
+
+        directory is compared as given, like the paths fonts are asked for.
+        """
+
+        for key in [key for key in self._fonts if theme_pack.is_within(key[0], directory)]:
+            del self._fonts[key]
+        self._pending = deque(
+            request for request in self._pending if not theme_pack.is_within(request[0], directory)
+            )
+
+    def clear(self):
+        """forget every font, and every font queued to be opened"""
+
+        self._fonts.clear()
+        self._pending.clear()
+
+    @property
+    def hits(self):
+        """get the number of gets answered with an open font"""
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """get the number of gets that had to open a font"""
+
+        return self._misses
+
+    @property
+    def preloaded(self):
+        """get the number of fonts opened by load_pending"""
+
+        return self._preloaded
+
+    def stats(self):
+        """get the registry statistics as a dictionary"""
+
+        return {
+            "fonts": len(self._fonts),
+            "hits": self._hits,
+            "misses": self._misses,
+            "pending": len(self._pending),
+            "preloaded": self._preloaded,
+            }
+
+
+_REGISTRY = FontRegistry()
+
+
+def get_registry():
+    """get the registry shared by every scene"""
+
+    return _REGISTRY
+
+
+def get(filename, size):
+    """get a font through the shared registry"""
+
+    return _REGISTRY.get(filename, size)
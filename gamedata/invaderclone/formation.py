@@ -0,0 +1,115 @@
+"""Moves a swarm of enemy ships as a single rigid body"""
+
+import pygame
+
+
+# pylint: disable=too-many-instance-attributes
+class Formation:
+    """one offset shared by every ship, which keeps a fixed slot in it
+
+    A ship's world position is its slot position plus the formation
+    offset, so moving the formation moves every ship at once.
+    """
+
+    def __init__(self, first_move, steps, speed=5):
+        """initialize a formation heading towards first_move"""
+
+        self._offset = pygame.math.Vector2(0, 0)
+        self._previous_offset = pygame.math.Vector2(0, 0)
+        self._target = pygame.math.Vector2(0, 0)
+        self._local_rect = pygame.Rect(0, 0, 0, 0)
+        self._version = 0
+        self.reset(first_move, steps, speed)
+
+    def reset(self, first_move, steps, speed=5):
+        """move the formation back to where it started, emptied of ships"""
+
+        self._offset.update(0, 0)
+        self._previous_offset.update(0, 0)
+        self._target.update(first_move)
+        self._steps = [pygame.math.Vector2(step) for step in steps]
+        self._step_idx = 0
+        self._speed = speed
+        self._stop = False
+
+        self._origin = (0, 0)
+        self._version += 1
+
+    def add(self, enemy):
+        """make the enemy's current position its slot in the formation"""
+
+        enemy.join_formation(self)
+
+    def update(self):
+        """move the formation, returning True if it reached its target"""
+
+        self._previous_offset.update(self._offset)
+        if not self._stop and self._offset.distance_squared_to(self._target):
+            self._offset.move_towards_ip(self._target, self._speed)
+
+            origin = (int(self._offset.x), int(self._offset.y))
+            if origin != self._origin:
+                self._origin = origin
+                self._version += 1
+
+        if self._offset.distance_squared_to(self._target):
+            return False
+
+        self._target = self._offset + self._steps[self._step_idx]
+        self._step_idx = (self._step_idx + 1) % len(self._steps)
+
+        return True
+
+    @property
+    def offset(self):
+        """get the exact offset of the formation"""
+
+        return self._offset
+
+    def offset_at(self, alpha):
+        """get the offset alpha of the way from the last update to this one"""
+
+        return self._previous_offset.lerp(self._offset, alpha)
+
+    @property
+    def origin(self):
+        """get the offset of the formation in whole pixels"""
+
+        return self._origin
+
+    @property
+    def version(self):
+        """get a number that changes whenever the origin does"""
+
+        return self._version
+
+    @property
+    def speed(self):
+        """get the speed of the formation"""
+
+        return self._speed
+
+    def inc_speed(self, val=2):
+        """increment the speed by a value"""
+
+        self._speed = self._speed + val
+
+    def stop(self):
+        """stop the formation"""
+
+        self._stop = True
+
+    def to_local(self, rect):
+        """translate a world rect into slot space
+
+        The returned rect is reused by the next call.
+        """
+
+        self._local_rect.update(
+            rect.x - self._origin[0],
+            rect.y - self._origin[1],
+            rect.width,
+            rect.height
+            )
+
+        return self._local_rect
@@ -2,7 +2,10 @@
 
 import os
 import sys
+import time
+import random
 import importlib
+import importlib.util
 import warnings
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
@@ -10,17 +13,26 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 import pygame
 
 import re
-
-from copy import deepcopy
+from functools import partial
 
 from . import rgbcolors
 from . import theme
-from .scene import Scene
+from .settings import GameSettings
+from .phase_timer import PhaseTimer
+from .perf_hud import PerfHud
+from .replay import ReplayRecorder, ReplayPlayer
+from . import surface_cache
+from . import font_registry
+from .scene_registry import SceneRegistry
 from .polygon_title_scene import PolygonTitleScene
 from .leaderboard_scene import LeaderboardScene
 from .game_over_scene import GameOverScene
 from .constants import LEVELS_DIR, CUSTOM_LEVELS_DIR
 
+# The most game updates run to catch up before a frame is drawn. Past
+# this, the game slows down instead of skipping every frame.
+MAX_TICKS_PER_FRAME = 5
+
 def display_info():
     """Print out information about the display driver and video information."""
     print(f'The display is using the "{pygame.display.get_driver()}" driver.')
@@ -35,11 +47,34 @@ class VideoGame:
         game_settings
     ):
         """Initialize new game with given window size & window title."""
-        pygame.init()
-        pygame.joystick.init()
+        if not isinstance(game_settings, GameSettings):
+            game_settings = GameSettings(game_settings)
         self._game_settings = game_settings
         gs = self._game_settings
 
+        self._replay = None
+        if gs["replay"]:
+            self._replay = ReplayPlayer(gs["replay"])
+            self._replay.apply_settings(gs)
+        if gs["record"] and gs["seed"] is None:
+            gs["seed"] = random.randrange(2 ** 32)
+        self._random = random.Random(gs["seed"])
+        self._recorder = ReplayRecorder(gs["record"], gs) if gs["record"] else None
+
+        self._headless = gs["headless"]
+        self._skip_draw = gs["skip_draw"]
+        self._max_ticks = gs["max_ticks"]
+        self._ticks = 0
+        self._perf_hud = PerfHud(1000. / max(1, gs["tick_rate"]), visible=gs["perf_hud"])
+        self._frame_timer = PhaseTimer()
+        self._scene_timer = PhaseTimer()
+        if self._headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        pygame.init()
+        pygame.joystick.init()
+
         self._window_size = (gs["width"], gs["height"])
         self._clock = pygame.time.Clock()
         self._screen = pygame.display.set_mode(self._window_size, pygame.HWSURFACE | pygame.DOUBLEBUF)
@@ -54,10 +89,13 @@ class VideoGame:
 
         self._theme = theme.Theme(gs["theme"])
 
-        icon = pygame.image.load(self._theme.get("title_icon", theme.FALLBACK_IMG))
-        icon_img = pygame.transform.scale(icon, (128,128))
+        icon_img = surface_cache.load(self._theme.get("title_icon", theme.FALLBACK_IMG), (128,128), alpha=False)
         pygame.display.set_icon(icon_img)
 
+    def _time_scene(self, scene):
+        """give a scene the scene timer while the perf hud is shown"""
+        scene.set_phase_timer(self._scene_timer if self._perf_hud.visible else None)
+
     @property
     def scene_graph(self):
         """Return the scene graph representing all the scenes in the game."""
@@ -93,74 +131,208 @@ class InvaderClone(VideoGame):
 
         levels = sorted(levels + [os.path.join(CUSTOM_LEVELS_DIR, level) for level in os.listdir(CUSTOM_LEVELS_DIR) if re.match(r'level[0-9]+.py', level) and level != "level0.py"])
 
-        level_modules = {}
+        self._level_files = {}
         self._level_classes = {}
 
         for level in levels:
             module_name, _ = os.path.splitext(os.path.basename(level))
-            spec = importlib.util.spec_from_file_location(f"invaderclone.{module_name}", level)
-            level_modules[f"invaderclone.{module_name}"] = importlib.util.module_from_spec(spec)
-            sys.modules[f"invaderclone.{module_name}"] = level_modules[f"invaderclone.{module_name}"]
-            spec.loader.exec_module(level_modules[f"invaderclone.{module_name}"])
-
             class_name = f"{module_name[0].upper()}{module_name[1:]}"
-            self._level_classes[class_name] = getattr(sys.modules[f"invaderclone.{module_name}"], class_name)
+            self._level_files[class_name] = level
         self.build_scene_graph()
 
-    def initialize_levels(self):
-        for level_name, LevelClass in self._level_classes.items():
-            self._scene_dict[level_name] = LevelClass(self._screen, self._game_settings)
+        # opened a few at a time by the title scene, off the startup path
+        screen_height = self._screen.get_height()
+        font_registry.get_registry().preload(
+            request
+            for SceneClass in (LeaderboardScene, GameOverScene)
+            for request in SceneClass.font_requests(self._theme, screen_height).values()
+            )
 
-            if not isinstance(self._scene_dict[level_name], Scene):
-                raise TypeError
+    def _level_class(self, level_name):
+        """import a level's module the first time the level is needed"""
+
+        if level_name not in self._level_classes:
+            level = self._level_files[level_name]
+            module_name, _ = os.path.splitext(os.path.basename(level))
+            spec = importlib.util.spec_from_file_location(f"invaderclone.{module_name}", level)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[f"invaderclone.{module_name}"] = module
+            spec.loader.exec_module(module)
+
+            self._level_classes[level_name] = getattr(module, level_name)
+
+        return self._level_classes[level_name]
+
+    def _level_factory(self, level_name):
+        """get a function that creates a level"""
+
+        return lambda: self._level_class(level_name)(self._screen, self._game_settings)
+
+    def initialize_levels(self):
+        for level_name in self._level_files:
+            self._scene_dict.register(level_name, self._level_factory(level_name))
 
     def reinitialize_levels(self):
-        self.initialize_levels()
+        """start the levels over for a new game
+
+        Themes whose files were added, removed or edited between games
+        are forgotten, along with what was loaded from them. Levels whose
+        theme changed are dropped and created again when next played; the
+        rest are reset in place.
+        """
+
+        theme.invalidate_changed()
+        created = [name for name in self._level_files if self._scene_dict.is_created(name)]
+        self._scene_dict.invalidate([
+            name for name in created if not self._scene_dict[name].theme_is_current()
+            ])
+
+        for level_name in created:
+            if self._scene_dict.is_created(level_name):
+                self._scene_dict[level_name].reset_scene()
 
     def build_scene_graph(self):
-        """Build scene graph for the game demo."""
+        """Build scene graph for the game demo.
+
+        Scenes are only created when the game first changes to them.
+        """
 
         the_screen = self._screen
-        self._scene_dict = {
-            "PolygonTitleScene" : PolygonTitleScene(
-                the_screen,
-                self._game_settings
-                ),
-            "LeaderboardScene" : LeaderboardScene(
-                the_screen,
-                self._game_settings
-                ),
-            "GameOverScene" : GameOverScene(
-                the_screen,
-                self._game_settings
+        self._scene_dict = SceneRegistry()
+        for scene_name, SceneClass in (
+            ("PolygonTitleScene", PolygonTitleScene),
+            ("LeaderboardScene", LeaderboardScene),
+            ("GameOverScene", GameOverScene),
+            ):
+            self._scene_dict.register(
+                scene_name,
+                partial(SceneClass, the_screen, self._game_settings)
                 )
-        }
 
         self.initialize_levels()
 
     def run(self):
         """Run the game; the main game loop."""
         scene_iterator = self._scene_dict
-        current_scene_string = "PolygonTitleScene"
+        current_scene_string = self._game_settings["start_scene"]
+        if current_scene_string not in scene_iterator:
+            raise ValueError(f"there is no scene named {current_scene_string}")
         current_level = 0
-        num_levels = len(self._level_classes.keys())
+        num_levels = len(self._level_files)
 
         while not self._game_is_over:
             current_scene = scene_iterator[current_scene_string]
             current_scene.clock()
+            current_scene.seed(self._random.getrandbits(64))
             current_scene.start_scene()
-            reference_settings = deepcopy(self._game_settings)
             current_scene.update_settings()
-
-            while current_scene.is_valid():
-                self._clock.tick(current_scene.frame_rate())
+            self._time_scene(current_scene)
+            settings_version = self._game_settings.version
+            settings_keys = current_scene.settings_keys()
+
+            tick_length = 1. / max(1, self._game_settings["tick_rate"])
+            lag = tick_length
+            previous_time = time.perf_counter()
+
+            perf_hud = self._perf_hud
+            frame_timer = self._frame_timer
+
+            replay_speed = self._game_settings["replay_speed"]
+
+            while current_scene.is_valid() and not self._game_is_over:
+                if self._replay is not None:
+                    frame = self._replay.next_frame()
+                    if frame is None:
+                        self._game_is_over = True
+                        break
+                    due, replayed_events = frame
+                    if replay_speed > 0 and not self._headless:
+                        previous_time += due * tick_length / replay_speed
+                        wait = previous_time - time.perf_counter()
+                        if wait > 0:
+                            time.sleep(wait)
+                        else:
+                            previous_time -= wait
+                else:
+                    if self._headless:
+                        lag = tick_length
+                    else:
+                        self._clock.tick(current_scene.frame_rate())
+                        current_time = time.perf_counter()
+                        lag += current_time - previous_time
+                        previous_time = current_time
+
+                    due = int(lag // tick_length)
+                    if due > MAX_TICKS_PER_FRAME:
+                        due = MAX_TICKS_PER_FRAME
+                        lag %= tick_length
+                    else:
+                        lag -= due * tick_length
+
+                frame_timer.start()
+                events = []
                 for event in pygame.event.get():
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        perf_hud.toggle()
+                        self._time_scene(current_scene)
+                        continue
+                    if self._replay is not None:
+                        if (
+                            event.type == pygame.QUIT
+                            or
+                            event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                            self._game_is_over = True
+                        continue
+                    events.append(event)
+                if self._replay is not None:
+                    events = replayed_events
+                for event in events:
                     current_scene.process_event(event)
-                current_scene.update_scene()
-                if reference_settings != self._game_settings:
-                    current_scene.update_settings()
+                frame_timer.mark("events")
+
+                ticks = 0
+                while ticks < due and current_scene.is_valid():
+                    current_scene.tick()
+                    current_scene.update_scene()
+                    if self._game_settings.version != settings_version:
+                        if self._game_settings.changed_since(settings_version, settings_keys):
+                            current_scene.update_settings()
+                        settings_version = self._game_settings.version
+                    ticks += 1
+
+                    self._ticks += 1
+                    if self._max_ticks and self._ticks >= self._max_ticks:
+                        self._game_is_over = True
+                        break
+                frame_timer.mark("update_scene")
+
+                if self._recorder is not None:
+                    self._recorder.record(ticks, events)
+
+                if self._skip_draw:
+                    continue
+
+                current_scene.set_interpolation(1. if self._headless else min(lag / tick_length, 1.))
                 current_scene.draw()
-                pygame.display.update()
+                frame_timer.mark("draw")
+                if perf_hud.visible:
+                    current_scene.draw_perf_hud(perf_hud)
+                    frame_timer.mark("hud")
+
+                if not self._headless:
+                    dirty_rects = current_scene.dirty_rects()
+                    if dirty_rects is None:
+                        pygame.display.update()
+                    else:
+                        pygame.display.update(dirty_rects)
+                    frame_timer.mark("display_update")
+
+                frame_timer.end_frame()
+                if perf_hud.visible:
+                    self._scene_timer.end_frame()
+                    perf_hud.record(frame_timer.last_frame, self._scene_timer.last_frame)
+            if self._game_is_over:
+                break
             command = current_scene.end_scene()
             current_scene.reset_scene()
 
@@ -185,8 +357,8 @@ class InvaderClone(VideoGame):
                     self._game_settings["current_difficulty_modifier"] = 1.0
                     self._game_settings["current_score_p1"] = 0
                     self._game_settings["current_score_p2"] = 0
-                    self._game_settings["current_lives_p1"] = game_settings["starting_lives"]
-                    self._game_settings["current_lives_p2"] = game_settings["starting_lives"]
+                    self._game_settings["current_lives_p1"] = self._game_settings["starting_lives"]
+                    self._game_settings["current_lives_p2"] = self._game_settings["starting_lives"]
                     self._game_settings["oneups"] = []
 
                     current_level = 0
@@ -194,5 +366,9 @@ class InvaderClone(VideoGame):
                     self.reinitialize_levels()
 
                     current_scene_string = scene_name
+        if self._recorder is not None:
+            self._recorder.close()
+        if self._replay is not None:
+            self._replay.close()
         pygame.quit()
         return 0
@@ -2,11 +2,11 @@
 
 import pygame
 
-import time
-
 from .press_any_key_to_exit_scene import PressAnyKeyToExitScene
 from . import rgbcolors
 from . import theme
+from . import surface_cache
+from . import font_registry
 
 class GameOverScene(PressAnyKeyToExitScene):
     """a game over scene"""
@@ -32,15 +32,31 @@ class GameOverScene(PressAnyKeyToExitScene):
 
         self.update_settings()
 
+    def reset_state(self):
+        super().reset_state()
+
+        self._y = False
+
+    @classmethod
+    def font_requests(cls, scene_theme, screen_height):
+        pixel_font = scene_theme.get("pixelfont", theme.FALLBACK_FNT)
+
+        return {
+            "title": (pixel_font, screen_height // 11),
+            "confirm": (pixel_font, screen_height // 57),
+            }
+
     def update_settings(self, new_settings=None):
         gs = self._game_settings if new_settings is None else new_settings
         cd = rgbcolors.color_dictionary
 
         screen_height = self._screen.get_height()
-        title_font_size = screen_height // 11
-        confirm_font_size = screen_height // 57
+        fonts = {
+            name: font_registry.get(*request)
+            for name, request in self.font_requests(self._theme, screen_height).items()
+            }
 
-        string_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), title_font_size)
+        string_font = fonts["title"]
 
         self._score = gs["current_score_p1"]
         self._score_p2 = gs["current_score_p2"]
@@ -49,7 +65,7 @@ class GameOverScene(PressAnyKeyToExitScene):
             string_font, gs["game_over"], True, cd[gs["game_over_text_color"]]
         )
 
-        confirm_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), confirm_font_size)
+        confirm_font = fonts["confirm"]
 
         self._confirm_screen = pygame.font.Font.render(
             confirm_font, gs["continueyn"], True, cd[gs["continueyn_text_color"]]
@@ -66,17 +82,15 @@ class GameOverScene(PressAnyKeyToExitScene):
             cd[gs["game_over_text_color"]]
         )
 
-        img = pygame.image.load(self._theme.get("gameover_icon", theme.FALLBACK_IMG)).convert_alpha()
-
         height = screen_height // 8
 
-        self._title_img = pygame.transform.scale(img, (height, height))
+        self._title_img = surface_cache.load(self._theme.get("gameover_icon", theme.FALLBACK_IMG), (height, height))
 
 
     def process_event(self, event):
         """Process game events."""
 
-        if time.time() >= self._timestart + 3:
+        if self.elapsed() >= 3:
             if (
                 event.type == pygame.KEYDOWN and event.key == pygame.K_y
                 or
@@ -108,7 +122,7 @@ class GameOverScene(PressAnyKeyToExitScene):
             self._game_over, ((s_w // 2) - t_x // 2, (s_h // 2) - t_y // 2)
         )
 
-        if time.time() >= self._timestart + 3:
+        if self.elapsed() >= 3:
             p_x = self._confirm_screen.get_width()
             p_y = self._confirm_screen.get_height()
 
@@ -0,0 +1,254 @@
+"""HUD numbers drawn from glyphs rasterized once into an atlas"""
+
+import pygame
+
+
+DIGITS = "-0123456789"
+
+
+class GlyphAtlas:
+    """the glyphs of some characters in one font and color, side by side
+
+    Each glyph is rasterized once, when the atlas is made. Text made of
+    them is laid out glyph by glyph, each glyph's width as its advance,
+    and copied from the atlas with no blending. exact says whether that
+    gives the same pixels as Font.render for every pair of characters,
+    which kerning or glyphs that overhang their neighbours would break.
+    """
+
+    def __init__(self, font, color, characters=DIGITS):
+        """initialize an atlas of characters drawn with font in color"""
+
+        self._font = font
+        self._color = color
+        self._characters = characters
+        self._height = font.get_height()
+        self._rects = {}
+        self._widths = {}
+
+        glyphs = [(character, font.render(character, True, color)) for character in characters]
+        self._surface = pygame.Surface(
+            (max(1, sum(glyph.get_width() for _, glyph in glyphs)), self._height), pygame.SRCALPHA
+            )
+
+        left = 0
+        for character, glyph in glyphs:
+            # copy the glyph's pixels as they are instead of blending them onto nothing
+            glyph.set_alpha(None)
+            self._rects[character] = self._surface.blit(glyph, (left, 0))
+            self._widths[character] = glyph.get_width()
+            left += glyph.get_width()
+        self._surface.set_alpha(None)
+        self._max_width = max(self._widths.values(), default=0)
+
+        # a glyph copied onto old text must cover all of it
+        self.exact = all(glyph.get_height() == self._height for _, glyph in glyphs) and all(
+            self.matches(first + second) for first in characters for second in characters
+            )
+
+    @property
+    def font(self):
+        """get the font"""
+
+        return self._font
+
+    @property
+    def color(self):
+        """get the color"""
+
+        return self._color
+
+    @property
+    def characters(self):
+        """get the characters in the atlas"""
+
+        return self._characters
+
+    @property
+    def height(self):
+        """get the height of a line of text"""
+
+        return self._height
+
+    @property
+    def max_width(self):
+        """get the width of the widest glyph"""
+
+        return self._max_width
+
+    def width(self, text):
+        """get the width text is drawn at"""
+
+        return sum(map(self._widths.__getitem__, text))
+
+    def draw(self, surface, text, left, lefts=None):
+        """copy the glyphs of text onto the top of surface from left, returning where they end
+
+        Where each glyph ends is appended to lefts if it is given.
+        """
+
+        atlas = self._surface
+        rects = self._rects
+        blit = surface.blit
+        for character in text:
+            rect = rects[character]
+            blit(atlas, (left, 0), rect)
+            left += rect.width
+            if lefts is not None:
+                lefts.append(left)
+
+        return left
+
+    def matches(self, text, label="", rendered_label=None):
+        """tell whether label followed by text from the atlas looks like Font.render
+
+        rendered_label is label rendered by Font.render with blending off.
+        """
+
+        expected = self._font.render(label + text, True, self._color)
+        label_width = 0 if rendered_label is None else rendered_label.get_width()
+
+        if expected.get_size() != (label_width + self.width(text), self._height):
+            return False
+
+        composed = pygame.Surface(expected.get_size(), pygame.SRCALPHA)
+        if rendered_label is not None:
+            composed.blit(rendered_label, (0, 0))
+        self.draw(composed, text, label_width)
+
+        return pygame.image.tobytes(composed, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+
+class NumberText:
+    """a label and a number, kept on their own surface
+
+    The label is rendered once. Setting the number only stores it; the
+    next draw or measurement copies the digits that changed from the
+    atlas and clears the ones that went away, so a number that changes
+    several times in a frame is composed once and never rasterized.
+    Drawing it is one blit, like a surface from Font.render. Where the
+    atlas does not lay the text out the way Font.render does, it is
+    rendered with Font.render on change instead.
+    """
+
+    def __init__(self, atlas, label, value=0):
+        """initialize label followed by value, drawn with atlas"""
+
+        self._atlas = atlas
+        self._label_text = label
+        self._label = atlas.font.render(label, True, atlas.color)
+        self._label.set_alpha(None)
+        self._value = value
+        self._drawn_value = None
+        self._digits = None
+        self._surface = None
+        self._blank = None
+        self._width = 0
+        self._lefts = []
+        self._exact = atlas.exact and all(
+            atlas.matches(character, label, self._label) for character in atlas.characters
+            )
+
+    @property
+    def value(self):
+        """get the number"""
+
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """set the number, drawn when it is next drawn or measured"""
+
+        self._value = value
+
+    def _compose(self):
+        """get a surface showing the label and number, updating it if the number changed"""
+
+        value = self._value
+        if value is self._drawn_value:
+            return self._surface
+        self._drawn_value = value
+
+        digits = str(value)
+        old = self._digits
+        if digits == old:
+            return self._surface
+
+        atlas = self._atlas
+        if not self._exact or digits.strip(atlas.characters):
+            self._surface = atlas.font.render(self._label_text + digits, True, atlas.color)
+            self._width = self._surface.get_width()
+            # a rendered surface is replaced, not patched, on the next change
+            self._digits = digits
+            self._blank = None
+            return self._surface
+
+        same = 0
+        if self._blank is not None:
+            for old_character, character in zip(old, digits):
+                if old_character != character:
+                    break
+                same += 1
+
+        # lefts[num] is where digit num starts, and the last one where the text ends
+        lefts = self._lefts
+        height = atlas.height
+        if self._blank is None or lefts[same] + atlas.max_width * (len(digits) - same) > self._surface.get_width():
+            # leave room for a few more digits before the next resize
+            width = self._label.get_width() + atlas.width(digits)
+            self._surface = pygame.Surface((width + 4 * height, height), pygame.SRCALPHA)
+            self._blank = pygame.Surface(self._surface.get_size(), pygame.SRCALPHA)
+            self._blank.set_alpha(None)
+            self._surface.blit(self._label, (0, 0))
+            lefts = self._lefts = [self._label.get_width()]
+            same = 0
+            self._width = lefts[0]
+
+        del lefts[same + 1:]
+        left = atlas.draw(self._surface, digits[same:], lefts[same], lefts)
+
+        # new glyphs cover the old ones, so only text past the new end needs clearing
+        if self._width > left:
+            self._surface.blit(self._blank, (left, 0), (0, 0, self._width - left, height))
+        self._digits = digits
+        self._width = left
+
+        return self._surface
+
+    def get_width(self):
+        """get the width of the text"""
+
+        self._compose()
+
+        return self._width
+
+    def get_height(self):
+        """get the height of the text"""
+
+        return self._atlas.height
+
+    def draw(self, surface, position):
+        """draw the text with its top left at position, returning the rect it covers"""
+
+        return surface.blit(self._compose(), position, (0, 0, self._width, self._atlas.height))
+
+
+_ATLASES = {}
+
+
+def get_atlas(font, color):
+    """get the digit atlas shared by everyone drawing with font in color"""
+
+    key = (font, tuple(color))
+
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = GlyphAtlas(font, color)
+
+    return atlas
+
+
+def clear_atlases():
+    """forget every atlas, letting go of the fonts they were made from"""
+
+    _ATLASES.clear()
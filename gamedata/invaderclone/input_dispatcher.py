@@ -0,0 +1,60 @@
+"""Routes input events to player actions through a lookup table"""
+
+import pygame
+
+
+_CODE_ATTRIBUTES = {
+    pygame.KEYDOWN: "key",
+    pygame.KEYUP: "key",
+    pygame.JOYBUTTONDOWN: "button",
+    pygame.JOYBUTTONUP: "button",
+    pygame.JOYAXISMOTION: "axis",
+    pygame.JOYHATMOTION: "hat",
+    }
+
+
+class InputDispatcher:
+    """maps (event type, key/button/axis) to the actions bound to it"""
+
+    def __init__(self):
+        """initialize a dispatcher with no bindings"""
+
+        self._bindings = {}
+        self._joystick_players = {}
+
+    def bind(self, event_type, code, action, player=None):
+        """call action(player, event) for events of a type and code
+
+        With player left as None, the action gets the number of the player
+        whose joystick sent the event, and keyboard events are ignored.
+        """
+
+        self._bindings.setdefault((event_type, code), []).append((player, action))
+
+    def set_joysticks(self, joysticks):
+        """assign joysticks to players in order"""
+
+        self._joystick_players = {} if joysticks is None else {
+            joystick.get_instance_id(): number
+            for number, joystick in enumerate(joysticks)
+            }
+
+    def dispatch(self, event):
+        """run every action bound to an event, returning if there were any"""
+
+        attribute = _CODE_ATTRIBUTES.get(event.type)
+        if attribute is None:
+            return False
+
+        bindings = self._bindings.get((event.type, getattr(event, attribute, None)))
+        if not bindings:
+            return False
+
+        for player, action in bindings:
+            if player is None:
+                player = self._joystick_players.get(getattr(event, "instance_id", None))
+                if player is None:
+                    continue
+            action(player, event)
+
+        return True
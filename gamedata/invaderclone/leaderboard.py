@@ -1,17 +1,17 @@
 """Implements a leaderboard"""
 
-import pickle
-from os.path import join
+from .constants import save_path
+from .score_journal import ScoreJournal
 
 LEADERBOARD_VERSION_NAME = "beebo"
 
 class Leaderboard:
     """a leaderboard"""
 
-    def __init__(self):
+    def __init__(self, scores=None):
         """initialize a leaderbaord"""
         self._version_name = LEADERBOARD_VERSION_NAME
-        self._scores = []
+        self._scores = [] if scores is None else list(scores)
 
     def add_score(self, score):
         """add a score to the leaderboard"""
@@ -50,19 +50,73 @@ class Leaderboard:
         lowest = len(self._scores) - 1
         return self._scores[lowest]
 
-    def save(self, path):
-        """save the scores to a file"""
 
-        save_filename = join(path, "scores.pkle")
-        with open(save_filename, "wb") as handle:
-            pickle.dump(self, handle, pickle.HIGHEST_PROTOCOL)
+class SharedLeaderboard:
+    """the one leaderboard every scene reads
 
+    The scores are only read the first time they are needed, and every
+    added score is saved straight away. Saving, or invalidating, picks up
+    scores other running games have added; the leaderboard scene
+    invalidates each time it starts. version changes whenever the scores
+    do.
+    """
 
-def create_leaderboard_from_pickle(apickle):
-    """create a leaderboard from a file"""
+    def __init__(self, directory):
+        """initialize a shared leaderboard saved in a directory"""
 
-    with open(apickle, "rb") as handle:
-        leader = pickle.load(handle)
-        leader.sort()
+        self._journal = ScoreJournal(directory, LEADERBOARD_VERSION_NAME)
+        self._leaderboard = None
+        self._version = 0
 
-    return leader
+    def _load(self):
+        if self._leaderboard is None:
+            self._leaderboard = Leaderboard(self._journal.load())
+
+        return self._leaderboard
+
+    @property
+    def version(self):
+        """get a number that changes whenever the scores do"""
+
+        return self._version
+
+    @property
+    def version_name(self):
+        return self._load().version_name
+
+    @property
+    def scores(self):
+        """get the scores"""
+
+        return self._load().scores
+
+    @property
+    def lowest(self):
+        """get the lowest score"""
+
+        return self._load().lowest
+
+    def add_score(self, score):
+        """add a score to the leaderboard and save it"""
+
+        self._leaderboard = Leaderboard(self._journal.append(score))
+        self._version += 1
+
+    def invalidate(self):
+        """forget the loaded scores so they are read again"""
+
+        self._leaderboard = None
+        self._version += 1
+
+
+_shared = {}
+
+
+def get_leaderboard(directory=save_path):
+    """get the leaderboard shared by every scene"""
+
+    shared = _shared.get(directory)
+    if shared is None:
+        shared = _shared[directory] = SharedLeaderboard(directory)
+
+    return shared
@@ -5,10 +5,9 @@ import pygame
 from .press_any_key_to_exit_scene import PressAnyKeyToExitScene
 from . import rgbcolors
 from . import theme
-from .constants import save_path
+from . import font_registry
 
 from datetime import datetime
-import time
 
 class LeaderboardScene(PressAnyKeyToExitScene):
     """a leaderboard"""
@@ -36,15 +35,21 @@ class LeaderboardScene(PressAnyKeyToExitScene):
         self._confirm_screen = None
         self.update_settings()
 
-    def reset_scene(self):
-        super().reset_scene()
+    def reset_state(self):
+        super().reset_state()
 
-        self.__init__(self._screen, self._game_settings)
+        self._y = False
+
+    def start_scene(self):
+        """start the scene, reading scores other games have added since"""
+
+        self._leaderboard.invalidate()
+        super().start_scene()
 
     def process_event(self, event):
         """Process game events."""
 
-        if time.time() >= self._timestart + 3:
+        if self.elapsed() >= 3:
             if (
                 event.type == pygame.KEYDOWN and event.key == pygame.K_y
                 or
@@ -58,17 +63,27 @@ class LeaderboardScene(PressAnyKeyToExitScene):
 
         self._score = value
 
+    @classmethod
+    def font_requests(cls, scene_theme, screen_height):
+        pixel_font = scene_theme.get("pixelfont", theme.FALLBACK_FNT)
+
+        return {
+            "title": (pixel_font, screen_height // 11),
+            "leaderboard": (pixel_font, screen_height // 57),
+            "confirm": (pixel_font, screen_height // 57),
+            }
+
     def update_settings(self, new_settings = None):
         super().update_settings()
         gs = self._game_settings
         cd = rgbcolors.color_dictionary
 
-        screen_height = self._screen.get_height()
-
-        title_font_size = screen_height // 11
-        lb_font_size = confirm_font_size = screen_height // 57
+        fonts = {
+            name: font_registry.get(*request)
+            for name, request in self.font_requests(self._theme, self._screen.get_height()).items()
+            }
 
-        string_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), title_font_size)
+        string_font = fonts["title"]
         self._score = gs["current_score_p1"]
         self._score_p2 = gs["current_score_p2"]
         self._lives = gs["current_lives_p1"]
@@ -82,7 +97,7 @@ class LeaderboardScene(PressAnyKeyToExitScene):
         leaderboard = [f"{count + 1}. {word[0]} - {word[1]}"
                        for count, word in enumerate(self._leaderboard.scores)]
 
-        lb_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), lb_font_size)
+        lb_font = fonts["leaderboard"]
 
         self._lb_font = [pygame.font.Font.render(
             lb_font,
@@ -91,7 +106,7 @@ class LeaderboardScene(PressAnyKeyToExitScene):
             rgbcolors.ghostwhite
             ) for phrase in leaderboard]
 
-        confirm_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), confirm_font_size)
+        confirm_font = fonts["confirm"]
 
         self._confirm_screen = pygame.font.Font.render(
             confirm_font, gs["continueyn"], True, rgbcolors.ghostwhite
@@ -122,7 +137,7 @@ class LeaderboardScene(PressAnyKeyToExitScene):
                     (position[0],
                      position[1] + (num * 14) + (num * 4)))
 
-        if time.time() >= self._timestart + 3:
+        if self.elapsed() >= 3:
             p_x = self._confirm_screen.get_width()
             p_y = self._confirm_screen.get_height()
 
@@ -141,7 +156,6 @@ class LeaderboardScene(PressAnyKeyToExitScene):
         if lblen < 10 or self._score > self._leaderboard.lowest[0]:
             self._leaderboard.add_score((self._score, datetime.now().strftime(
                 "%Y-%m-%d %H:%M:%S")))
-            self._leaderboard.save(save_path)
 
         yes = self._y
         self._y = False
@@ -2,22 +2,41 @@
 
 import pygame
 
-import threading
-import time
-
-from random import randint, choice, randrange, uniform
 
 from .scene import Scene
 from . import rgbcolors
 from . import theme
+from . import theme_pack
+from . import surface_cache
+from . import font_registry
+from .hud_text import NumberText, get_atlas
 from . import player
 from .explosion import Explosion
 from .enemy import EnemyShip
 from . import bullets
+from .bullet_store import BulletStore
+from .object_pool import ObjectPool
+from .entity_list import EntityList
 from . import burst_shot_powerup
 from .obstacle import Obstacle
+from .spatial_hash import SpatialHash
+from .column_index import ColumnIndex
+from .formation import Formation
+from .input_dispatcher import InputDispatcher
+from .dirty_rect_renderer import DirtyRectRenderer
 from .constants import PLAYER_SIZE_MODIFIER, ENEMY_SIZE_MODIFIER
 
+# The level writes the player 1 score and lives itself, so changes to them
+# don't need another update_settings.
+_SETTINGS_KEYS = frozenset((
+    "frame_rate", "player_speed", "player_bullet_speed", "enemy_speed",
+    "obstacle_speed", "powerup_speed", "powerup_chance", "obstacle_chance",
+    "disable_stars", "enable_background", "bg_speed",
+    "current_difficulty_modifier", "rows", "columns",
+    "oneup_score", "powerup_score", "death_penalty",
+    "current_score_p2", "current_lives_p2", "ingame_font_color",
+    ))
+
 
 class Level0(Scene):
     """Scene which implements a level in the game"""
@@ -51,58 +70,74 @@ class Level0(Scene):
         self._num_rows = None
         self._num_cols = None
         self._score_font = None
-        self._score_surface = None
-        self._lives_surface = None
-        self._lives_surface_p2 = None
+        self._score_text = None
+        self._lives_text = None
+        self._lives_text_p2 = None
         self._life_picture = None
         self._life_picture_p2 = None
         self._lastshot = 0
+        self._fire_held = False
 
         self.update_settings()
 
         self._width, self._height = self._screen.get_size()
 
         self._player = player.Player(
-            pygame.math.Vector2(self._width // 2, self._height - (10 + screen.get_height() // PLAYER_SIZE_MODIFIER)),
+            self._player_start(),
             self._screen,
             self._sprite_dict["hero"],
-            self._player_speed
+            self._player_speed,
+            clock=self.elapsed
         )
 
         self._player2 = None
-        self._make_player2()
 
-        self._explosion_sound = pygame.mixer.Sound(self._theme.get("explode", theme.FALLBACK_SND))
-        self._exploding_kitty = pygame.mixer.Sound(self._theme.get("explode+kitty", theme.FALLBACK_SND))
-        self._bullets = []
-        self._powerups = []
-        self._enemies = []
-        self._explosions = []
-        self._obstacles = []
-        self._speedupswitch = 4
-        self._inc_pos_idx = False
+        self._input = None
+        self._bind_controls()
 
-        enemy_size = self._height // ENEMY_SIZE_MODIFIER
-        gutter_width = enemy_size // 8
-        down = enemy_size + gutter_width
+        self._renderer = DirtyRectRenderer(self._screen) if self._game_settings["dirty_rects"] else None
 
-        self._horizontal_width = (enemy_size * self._num_cols) + (gutter_width * (self._num_cols)) + (gutter_width * 4)
+        self._explosion_sound = None
+        self._exploding_kitty = None
+        self._bullets = BulletStore()
+        self._pool = ObjectPool()
+        self._powerups = EntityList()
+        self._enemies = EntityList()
+        self._explosions = EntityList()
+        self._obstacles = EntityList()
+
+        cell_size = self._height // ENEMY_SIZE_MODIFIER
+        self._player_grid = SpatialHash(cell_size)
+        self._enemy_grid = SpatialHash(cell_size)
+        self._obstacle_grid = SpatialHash(cell_size)
+        self._columns = ColumnIndex()
 
-        self._go = self._width - self._horizontal_width
-        self._positions = [(0, down), (-self._go, 0),
-                           (0, down), (self._go, 0)]
-        self._pos_idx = 0
+        self._speedupswitch = 4
+        self._formation = None
+        self._go = None
+        self._positions = None
+        self._horizontal_width = None
 
         self._scroll_bg = 0
-        if self._stars:
-            self._scroll = 0
+        self._scroll = 0
+        self._random_space = None
 
+        self.load_resources()
+        self.reset_state()
+
+    def load_resources(self):
+        """load the sounds and draw the starfield, once per level"""
+
+        self._explosion_sound = pygame.mixer.Sound(theme_pack.resolve(self._theme.get("explode", theme.FALLBACK_SND)))
+        self._exploding_kitty = pygame.mixer.Sound(theme_pack.resolve(self._theme.get("explode+kitty", theme.FALLBACK_SND)))
+
+        if self._stars:
             random_coords = [
                 (i, j)
                 for i in range(1, self._screen.get_width())
                 for j in range(1, self._screen.get_height())
-                if i % 2 and randint(0, 1000) < 30 and
-                j % 2 and randint(0, 1000) < 30
+                if i % 2 and self._random.randint(0, 1000) < 30 and
+                j % 2 and self._random.randint(0, 1000) < 30
                 ]
 
             star_colors = [
@@ -130,14 +165,61 @@ class Level0(Scene):
             for coord in random_coords:
                 self._random_space.set_at(
                     coord,
-                    choice(star_colors))
+                    self._random.choice(star_colors))
+
+    def reset_state(self):
+        """start the level over, recycling every entity instead of reloading"""
+
+        super().reset_state()
+
+        gs = self._game_settings
+        self._score = gs["current_score_p1"]
+        self._lives = gs["current_lives_p1"]
+        self._score_p2 = gs["current_score_p2"]
+        self._lives_p2 = gs["current_lives_p2"]
+        self._difficulty_mod = gs["current_difficulty_modifier"]
+
+        self._lastshot = 0
+        self._fire_held = False
+        self._speedupswitch = 4
+        self._scroll_bg = 0
+        self._scroll = 0
+
+        self._compact_entities()
+        for entities in (self._enemies, self._explosions, self._obstacles, self._powerups):
+            for entity in entities:
+                self._pool.release(entity)
+            entities.clear()
+        self._bullets.clear()
+        self._player_grid.clear()
+        self._enemy_grid.clear()
+        self._obstacle_grid.clear()
+        self._columns.clear()
+
+        self._player.reset(self._player_start())
+        # gamepads may have come or gone while another scene was running
+        self._make_joysticks()
+        self._make_player2()
+        self._input.set_joysticks(self._joysticks)
+
+        if self._renderer is not None:
+            self._renderer.invalidate()
 
         self._make_enemies()
 
-    def reset_scene(self):
-        super().reset_scene()
+    def _player_start(self):
+        """get where player 1 starts and comes back after dying"""
+
+        return pygame.math.Vector2(self._width // 2, self._height - (10 + self._screen.get_height() // PLAYER_SIZE_MODIFIER))
+
+    @classmethod
+    def font_requests(cls, scene_theme, screen_height):
+        return {"score": (scene_theme.get("pixelfont", theme.FALLBACK_FNT), 16)}
 
-        self.__init__(self._screen, self._game_settings)
+    def settings_keys(self):
+        """get the settings update_settings reads, except the ones the level writes"""
+
+        return _SETTINGS_KEYS
 
     def update_settings(self, new_settings = None):
         super().update_settings()
@@ -146,25 +228,25 @@ class Level0(Scene):
         cd = rgbcolors.color_dictionary
         # Assets
         self._sprite_dict = {
-            "hero" : pygame.transform.scale(pygame.image.load(self._theme.get("hero", theme.FALLBACK_IMG)).convert_alpha(), (self._screen.get_height() // PLAYER_SIZE_MODIFIER,self._screen.get_height() // PLAYER_SIZE_MODIFIER)),
-            "second_hero": pygame.transform.scale(pygame.image.load(self._theme.get("second_hero", theme.FALLBACK_IMG)).convert_alpha(), (self._screen.get_height() // PLAYER_SIZE_MODIFIER,self._screen.get_height() // PLAYER_SIZE_MODIFIER)),
-            "playerbullet": pygame.image.load(self._theme.get("playerbullet", theme.FALLBACK_IMG)).convert_alpha(),
-            "enemybullet": pygame.image.load(self._theme.get("enemybullet", theme.FALLBACK_IMG)).convert_alpha(),
-            "explosion" : pygame.image.load(self._theme.get("explosion", theme.FALLBACK_IMG)).convert_alpha(),
-            "burst" : pygame.image.load(self._theme.get("burst", theme.FALLBACK_IMG)).convert_alpha(),
-            "bg" : pygame.transform.scale(pygame.image.load(self._theme.get("bg", theme.FALLBACK_IMG)).convert_alpha(), (self._screen.get_width(), self._screen.get_height())),
+            "hero" : surface_cache.load(self._theme.get("hero", theme.FALLBACK_IMG), (self._screen.get_height() // PLAYER_SIZE_MODIFIER,self._screen.get_height() // PLAYER_SIZE_MODIFIER)),
+            "second_hero": surface_cache.load(self._theme.get("second_hero", theme.FALLBACK_IMG), (self._screen.get_height() // PLAYER_SIZE_MODIFIER,self._screen.get_height() // PLAYER_SIZE_MODIFIER)),
+            "playerbullet": surface_cache.load(self._theme.get("playerbullet", theme.FALLBACK_IMG)),
+            "enemybullet": surface_cache.load(self._theme.get("enemybullet", theme.FALLBACK_IMG)),
+            "explosion" : surface_cache.load(self._theme.get("explosion", theme.FALLBACK_IMG)),
+            "burst" : surface_cache.load(self._theme.get("burst", theme.FALLBACK_IMG)),
+            "bg" : surface_cache.load(self._theme.get("bg", theme.FALLBACK_IMG), self._screen.get_size()),
             }
 
         self._enemy_list = []
         for e in self._theme.get_enemies():
             self._enemy_list.append(
-                pygame.transform.scale(pygame.image.load(e).convert_alpha(),(self._screen.get_height() // ENEMY_SIZE_MODIFIER, self._screen.get_height() // ENEMY_SIZE_MODIFIER))
+                surface_cache.load(e, (self._screen.get_height() // ENEMY_SIZE_MODIFIER, self._screen.get_height() // ENEMY_SIZE_MODIFIER))
                 )
 
         self._obstacle_list = []
         for o in self._theme.get_obstacles():
             self._obstacle_list.append(
-                pygame.image.load(o).convert_alpha()
+                surface_cache.load(o)
                 )
 
         # Speeds
@@ -201,20 +283,15 @@ class Level0(Scene):
         self._lives_p2 = gs["current_lives_p2"]
 
         # Fonts
-        self._score_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), 16)
-        self._score_surface = pygame.font.Font.render(
-            self._score_font, f"Score: {self._score}", True, cd[gs["ingame_font_color"]]
-        )
-        self._lives_surface = pygame.font.Font.render(
-            self._score_font, f"Lives: x{self._lives}", True, cd[gs["ingame_font_color"]]
-        )
-        self._lives_surface_p2 = pygame.font.Font.render(
-            self._score_font, f"Lives: x{self._lives_p2}", True, cd[gs["ingame_font_color"]]
-        )
-        self._life_picture = pygame.image.load(
-            self._theme.get("hero", theme.FALLBACK_IMG)).convert_alpha()
-        self._life_picture_p2 = pygame.image.load(
-            self._theme.get("second_hero", theme.FALLBACK_IMG)).convert_alpha()
+        self._score_font = font_registry.get(*self.font_requests(self._theme, self._screen.get_height())["score"])
+        atlas = get_atlas(self._score_font, cd[gs["ingame_font_color"]])
+        self._score_text = NumberText(atlas, "Score: ", self._score)
+        self._lives_text = NumberText(atlas, "Lives: x", self._lives)
+        self._lives_text_p2 = NumberText(atlas, "Lives: x", self._lives_p2)
+        self._life_picture = surface_cache.load(
+            self._theme.get("hero", theme.FALLBACK_IMG))
+        self._life_picture_p2 = surface_cache.load(
+            self._theme.get("second_hero", theme.FALLBACK_IMG))
 
 
     def _make_player2(self):
@@ -228,26 +305,29 @@ class Level0(Scene):
                 pygame.math.Vector2(player_2_x, player_2_y),
                 self._screen,
                 self._sprite_dict["second_hero"],
-                player_speed = self._player_speed
+                player_speed = self._player_speed,
+                clock=self.elapsed
             )
         else:
             self._player2 = None
 
+    def _index_players(self):
+        """put the players where they currently are in the player grid"""
+
+        self._player_grid.clear()
+        self._player_grid.insert(self._player)
+        if self._player2 is not None:
+            self._player_grid.insert(self._player2)
+
     def update_lives(self, value):
         """update the lives of the player"""
         gs = self._game_settings
-        cd = rgbcolors.color_dictionary
 
         templives = self._lives + value
         self._lives = templives if templives >= 0 else 0
         gs["current_lives_p1"] = self._lives
 
-        self._lives_surface = pygame.font.Font.render(
-            self._score_font,
-            f"Lives: x{self._lives}",
-            True,
-            cd[gs["ingame_font_color"]]
-        )
+        self._lives_text.value = self._lives
 
         if not self._lives:
             self._is_valid = False
@@ -255,18 +335,19 @@ class Level0(Scene):
     def spawn_obstacle(self):
         """spawn an obstacle that descends from the top of the screen"""
 
-        obstacle_choice = randrange(0, self._theme.num_obstacles())
-        img = pygame.image.load(self._theme.get_obstacle(obstacle_choice))
+        obstacle_choice = self._random.randrange(0, self._theme.num_obstacles())
+        img = self._obstacle_list[obstacle_choice]
 
         (width, height) = self._screen.get_size()
 
-        xpos = randint(0, width - img.get_width())
+        xpos = self._random.randint(0, width - img.get_width())
         ypos = 0 - img.get_height()
 
-        position = pygame.math.Vector2(xpos, ypos)
-        obstacle_target = position - pygame.math.Vector2(0, -(height + img.get_height()))
+        position = (xpos, ypos)
+        obstacle_target = (xpos, ypos + height + img.get_height())
         self._obstacles.append(
-            Obstacle(
+            self._pool.acquire(
+                Obstacle,
                 position,
                 obstacle_target,
                 min(self._obstacle_speed * self._difficulty_mod, 15),
@@ -274,6 +355,16 @@ class Level0(Scene):
                 )
             )
 
+    def spawn_enemy_bullet(self, position, speed=15):
+        """spawn an enemy bullet falling straight down from position"""
+
+        (_, height) = self._screen.get_size()
+
+        bullet_target = (position[0], position[1] + height)
+        self._bullets.spawn(
+            bullets.EnemyBullet, position, bullet_target, speed, self._sprite_dict["enemybullet"]
+        )
+
     def spawn_powerup(self):
         """spawn a powerup with the specified max time"""
 
@@ -281,25 +372,24 @@ class Level0(Scene):
             (burst_shot_powerup.BurstShotPowerup, 3, "burst")
             ]
 
-        powup_choice = choice(powerups)
+        powup_choice = self._random.choice(powerups)
 
         (width, height) = self._screen.get_size()
 
-        xpos = randint(32, width - 48)
+        xpos = self._random.randint(32, width - 48)
         ypos = 0
 
-        newpos = pygame.math.Vector2(xpos, ypos)
-        bullet_target = newpos - pygame.math.Vector2(0, -height - 16)
+        newpos = (xpos, ypos)
+        bullet_target = (xpos, ypos + height + 16)
 
         self._powerups.append(
-            powup_choice[0](newpos, bullet_target, self._powerup_speed, self._sprite_dict[powup_choice[2]], powup_choice[1])
+            self._pool.acquire(powup_choice[0], newpos, bullet_target, self._powerup_speed, self._sprite_dict[powup_choice[2]], powup_choice[1])
             )
 
     def update_score(self, value):
         """update the player score"""
 
         gs = self._game_settings
-        cd = rgbcolors.color_dictionary
 
         oldscore = self._score
         tempscore = self._score + value
@@ -316,7 +406,7 @@ class Level0(Scene):
         and life_newscore < life_oldscore
         and nearest_multiple not in gs["oneups"]):
             self.update_lives(1)
-            gs["oneups"].append(nearest_multiple)
+            gs["oneups"] = gs["oneups"] + [nearest_multiple]
 
         powup_oldscore = oldscore % self._powerup_score
         powup_newscore = tempscore % self._powerup_score
@@ -325,17 +415,12 @@ class Level0(Scene):
             value > 0
             and self._score > 0
             and powup_newscore < powup_oldscore
-            and randint(1, 101) < self._powup_chance
+            and self._random.randint(1, 101) < self._powup_chance
             ):
             self.spawn_powerup()
 
 
-        self._score_surface = pygame.font.Font.render(
-            self._score_font,
-            f"Score: {self._score}",
-            True,
-            cd[gs["ingame_font_color"]]
-        )
+        self._score_text.value = self._score
 
     def _make_enemies(self):
         numem = self._theme.num_enemies()
@@ -347,6 +432,12 @@ class Level0(Scene):
         x_step = gutter_width + enemy_size
         y_step = gutter_width + enemy_size
 
+        self._horizontal_width = (enemy_size * self._num_cols) + (gutter_width * (self._num_cols)) + (gutter_width * 4)
+
+        self._go = width - self._horizontal_width
+        self._positions = [(0, y_step), (-self._go, 0),
+                           (0, y_step), (self._go, 0)]
+
         max_cols = (int(width * .45) // (x_step)) - 1
         max_rows = (int(height * .33) // (y_step)) - 1
 
@@ -354,30 +445,40 @@ class Level0(Scene):
         num_rows = min(self._num_rows + int(self._difficulty_mod) - 1,  max_rows)
         enemy_kind = 0
 
+        formation_args = (
+            (self._go, 0),
+            self._positions,
+            min(self._enemy_speed * self._difficulty_mod, 10)
+            )
+        if self._formation is None:
+            self._formation = Formation(*formation_args)
+        else:
+            self._formation.reset(*formation_args)
+
         for i in range(num_rows):
             for j in range(enemies_per_row):
-               self._enemies.append(EnemyShip(
+               enemy = self._pool.acquire(
+                    EnemyShip,
                     pygame.math.Vector2(
                         x_step - enemy_size + (j * x_step), y_step + enemy_size + (i * y_step)
                     ),
                     self._screen,
                     self._enemy_list[enemy_kind],
                     min(self._enemy_speed * self._difficulty_mod, 10)
-                ))
+                )
+               self._formation.add(enemy)
+               self._enemies.append(enemy)
+               self._enemy_grid.insert(enemy, enemy.slot_rect)
+               self._columns.add(j, enemy)
             if (enemy_kind + 1) < numem:
                 enemy_kind += 1
 
-
-        for enemy in self._enemies:
-            target_x = enemy.position.x + self._go
-            target_y = enemy.position.y
-            enemy.target = pygame.math.Vector2(target_x, target_y)
-
     def kill_player1(self):
-        self._explosions.append(Explosion(self._player, self._sprite_dict["explosion"], self._player.width))
+        self._explosions.append(self._pool.acquire(Explosion, self._player, self._sprite_dict["explosion"], self._player.width))
         self._explosion_sound.play()
-        self._player.position = pygame.math.Vector2(self._width // 2, self._height - (10 + self._screen.get_height() // PLAYER_SIZE_MODIFIER))
+        self._player.position = self._player_start()
         self._player.invincible_clock()
+        self._player_grid.insert(self._player)
         self.update_score(int(self._death_penalty * self._difficulty_mod))
         self.update_lives(-1)
 
@@ -386,27 +487,81 @@ class Level0(Scene):
             gutter = self._player.width + (self._player.width // 2)
             player_2_x = self._player.position.x + gutter
             player_2_y = self._player.position.y
-            self._explosions.append(Explosion(self._player2, self._sprite_dict["explosion"], self._player2.width))
+            self._explosions.append(self._pool.acquire(Explosion, self._player2, self._sprite_dict["explosion"], self._player2.width))
             self._explosion_sound.play()
             self._player2.position = pygame.math.Vector2(player_2_x, player_2_y)
             self._player2.invincible_clock()
+            self._player_grid.insert(self._player2)
             # self.update_score(int(-100 * self._difficulty_mod))
             # self.update_lives(-1)
 
 
+    def _player_spans(self):
+        """get the (left, right, top, bottom) span of every player"""
+
+        players = [self._player] if self._player2 is None else [self._player, self._player2]
+        spans = []
+        for plyr in players:
+            rect = plyr.rect
+            spans.append((rect.left, rect.right, rect.top, rect.bottom))
+
+        return spans
+
+    def _is_above_player(self, enemy, player_spans):
+        """determine if a player is somewhere below an enemy"""
+
+        below = enemy.below_rect
+        for left, right, top, bottom in player_spans:
+            if (
+                left < below.right
+                and below.left < right
+                and top < below.bottom
+                and below.top < bottom
+                ):
+                return True
+
+        return False
+
+    def _scroll_backgrounds(self):
+        """move the background or the stars down, wrapping at the bottom"""
+
+        screen_height = self._screen.get_height()
+
+        if self._bg:
+            self._scroll_bg += self._bg_speed
+            if self._scroll_bg >= screen_height:
+                self._scroll_bg = 0
+
+        if self._stars and not self._bg:
+            self._scroll = self._scroll + self._bg_speed
+            if self._scroll >= screen_height:
+                self._scroll = 0
+
+    def _scroll_position(self, scroll, alpha):
+        """get where to draw a scrolled layer, alpha of the way from the last update"""
+
+        if not scroll:
+            return scroll
+
+        return scroll - self._bg_speed * (1. - alpha)
+
     # pylint: disable=too-many-statements too-many-branches
     def update_scene(self):
+        timer = self._phase_timer
+        if timer is not None:
+            timer.start()
+
+        self._scroll_backgrounds()
+
         if not self._lives:
             return
         if not self._enemies:
             self._is_valid = False
             return
 
-        self._inc_pos_idx = False
-
         super().update_scene()
 
-        spawn_obstacle_uniform = uniform(0, 101)
+        spawn_obstacle_uniform = self._random.uniform(0, 101)
         if spawn_obstacle_uniform < min(1., self._obstacle_chance + (self._difficulty_mod - 1.)):
             self.spawn_obstacle()
 
@@ -416,167 +571,174 @@ class Level0(Scene):
             self._player2.update()
             self.player_shoot(self._player2)
 
+        self._index_players()
+        if timer is not None:
+            timer.mark("players")
+
         for obstacle in self._obstacles:
             obstacle.update()
-            if obstacle.should_die() and obstacle in self._powerups:
-                self.obstacles.remove(obstacle)
+            if obstacle.should_die():
+                self._obstacles.kill(obstacle)
+            hit_players = self._player_grid.query(obstacle.rect)
             if (
-                obstacle.rect.colliderect(self._player.rect)
+                self._player in hit_players
                 and not self._player.invincible
                 ):
                 self.kill_player1()
-            if self._player2 and obstacle.rect.colliderect(self._player2.rect):
+            if self._player2 and self._player2 in hit_players:
                 self.kill_player2()
 
+        self._obstacle_grid.rebuild(self._obstacles)
+        if timer is not None:
+            timer.mark("obstacles")
+
         for explosion in self._explosions:
             explosion.update()
             if explosion.should_die:
-                if explosion in self._explosions:
-                    self._explosions.remove(explosion)
-
-
-        for bullet in self._bullets:
-            bullet.update()
-            if bullet in self._bullets:
+                self._explosions.kill(explosion)
+        if timer is not None:
+            timer.mark("explosions")
+
+        self._bullets.update()
+        for num in range(len(self._bullets)):
+            kind = self._bullets.kind(num)
+            bullet_rect = self._bullets.rect(num)
+            is_enemy_bullet = kind is bullets.EnemyBullet
+            if is_enemy_bullet:
+                hit_players = self._player_grid.query(bullet_rect)
                 if (
-                    bullet.rect.colliderect(self._player.rect)
+                    self._player in hit_players
                     and not self._player.invincible
-                    and isinstance(bullet, bullets.EnemyBullet)
                 ):
                     self.kill_player1()
                 if (
                     self._player2
-                    and bullet.rect.colliderect(self._player2.rect)
+                    and self._player2 in hit_players
                     and not self._player2.invincible
-                    and isinstance(bullet, bullets.EnemyBullet)
                 ):
-                   self.kill_player2()
-                if bullet.rect.collideobjects([obstacle for obstacle in self._obstacles]):
-                    if bullet in self._bullets:
-                        self._bullets.remove(bullet)
-                    if isinstance(bullet, bullets.PlayerBullet):
-                        self.update_score(int(-25 * self._difficulty_mod))
-                    if isinstance(bullet, bullets.PlayerBulletOneThird):
-                        self.update_score(int(-5 * self._difficulty_mod))
-                if bullet.should_die():
-                    if bullet in self._bullets:
-                        self._bullets.remove(bullet)
-                    if isinstance(bullet, bullets.PlayerBullet):
-                        self.update_score(int(-50 * self._difficulty_mod))
-                    if isinstance(bullet, bullets.PlayerBulletOneThird):
-                        self.update_score(int(-15 * self._difficulty_mod))
-                else:
-                    index = bullet.rect.collidelist(
-                        [c.rect for c in self._enemies])
-                    if index > -1 and not isinstance(bullet, bullets.EnemyBullet):
-                        self._explosions.append(Explosion(self._enemies[index], self._sprite_dict["explosion"], self._enemies[index].width))
-                        self._enemies[index].is_exploding = True
-                        self._enemies.remove(self._enemies[index])
-
-                        if randint(0, 100) >= 8:
-                            self._explosion_sound.play()
-                        else:
-                            self._exploding_kitty.play()
-
-                        if bullet in self._bullets:
-                            self._bullets.remove(bullet)
-                        self.update_score(int(200 * self._difficulty_mod))
-                        if not self._enemies:
-                            self._is_valid = False
-                            return
-
-        for enemy in self._enemies:
-            if enemy in self._enemies:
-                enemy.update()
-                if enemy.at_pos:
-                    t_x = enemy.position.x + self._positions[self._pos_idx][0]
-                    t_y = enemy.position.y + self._positions[self._pos_idx][1]
-                    enemy.original_position = enemy.target
-                    enemy.target = pygame.math.Vector2(t_x, t_y)
-                    if not self._inc_pos_idx:
-                        self._inc_pos_idx = True
-                if enemy.rect.colliderect(self._player.rect):
-                    if not self._player.is_dead:
-                        self._player.is_dead = True
-                        self.update_lives(-999)
-                        self._explosions.append(Explosion(self._player, self._sprite_dict["explosion"], self._player.width))
+                    self.kill_player2()
+            if self._obstacle_grid.collide(bullet_rect) is not None:
+                self._bullets.kill(num)
+                if kind is bullets.PlayerBullet:
+                    self.update_score(int(-25 * self._difficulty_mod))
+                if kind is bullets.PlayerBulletOneThird:
+                    self.update_score(int(-5 * self._difficulty_mod))
+            if self._bullets.should_die(num):
+                self._bullets.kill(num)
+                if kind is bullets.PlayerBullet:
+                    self.update_score(int(-50 * self._difficulty_mod))
+                if kind is bullets.PlayerBulletOneThird:
+                    self.update_score(int(-15 * self._difficulty_mod))
+            elif not is_enemy_bullet:
+                enemy = self._enemy_grid.collide(self._formation.to_local(bullet_rect))
+                if enemy is not None:
+                    self._explosions.append(self._pool.acquire(Explosion, enemy, self._sprite_dict["explosion"], enemy.width))
+                    enemy.is_exploding = True
+                    self._enemies.kill(enemy)
+                    self._enemy_grid.remove(enemy)
+                    self._columns.remove(enemy)
+
+                    if self._random.randint(0, 100) >= 8:
                         self._explosion_sound.play()
-                        for enemy in self._enemies:
-                            enemy.stop()
-
-                enmy = self._enemies
-                if enemy.below_rect.collidelist([c.rect for c in enmy]) < 0:
-                    collidelist = [self._player.rect] if self._player2 is None else [self._player.rect, self._player2.rect]
-                    fire_at_player = (1) if enemy.below_rect.collidelist(collidelist) < 0 else (10 * self._difficulty_mod)
-
-                    if randint(0, 10001) < min(20 * self._difficulty_mod + fire_at_player, 70):
-                        (_, height) = self._screen.get_size()
-
-                        newpos = pygame.math.Vector2(
-                            enemy.position.x + (enemy.width // 2), enemy.position.y
-                        )
-                        bullet_target = newpos - pygame.math.Vector2(0, -height)
-                        velocity = 15
-                        self._bullets.append(
-                            bullets.EnemyBullet(newpos, bullet_target, velocity, self._sprite_dict["enemybullet"])
-                        )
-        if self._inc_pos_idx:
-            if not self._speedupswitch:
-                for enemy in self._enemies:
-                    if enemy.speed <= 10:
-                        enemy.inc_speed(min(0.5 * self._difficulty_mod, 2))
+                    else:
+                        self._exploding_kitty.play()
+
+                    self._bullets.kill(num)
+                    self.update_score(int(200 * self._difficulty_mod))
+                    if not self._enemies:
+                        self._compact_entities()
+                        self._is_valid = False
+                        return
+        if timer is not None:
+            timer.mark("bullets")
+
+        if self._formation.update():
+            if not self._speedupswitch and self._formation.speed <= 10:
+                self._formation.inc_speed(min(0.5 * self._difficulty_mod, 2))
 
             self._speedupswitch = (self._speedupswitch + 1) % 8
-            self._pos_idx = (self._pos_idx + 1) % 4
+
+        if (
+            not self._player.is_dead
+            and self._enemy_grid.collide(self._formation.to_local(self._player.rect)) is not None
+            ):
+            self._player.is_dead = True
+            self.update_lives(-999)
+            self._explosions.append(self._pool.acquire(Explosion, self._player, self._sprite_dict["explosion"], self._player.width))
+            self._explosion_sound.play()
+            self._formation.stop()
+
+        player_spans = self._player_spans()
+        for enemy in self._columns.front_line():
+            fire_at_player = (1) if not self._is_above_player(enemy, player_spans) else (10 * self._difficulty_mod)
+
+            if self._random.randint(0, 10001) < min(20 * self._difficulty_mod + fire_at_player, 70):
+                self.spawn_enemy_bullet((enemy.position.x + (enemy.width // 2), enemy.position.y))
+        if timer is not None:
+            timer.mark("enemies")
 
         for powup in self._powerups:
             powup.update()
-            if powup.should_die() and powup in self._powerups:
-                self._powerups.remove(powup)
-            if powup.rect.colliderect(self._player.rect):
+            if powup.should_die():
+                self._powerups.kill(powup)
+            hit_players = self._player_grid.query(powup.rect)
+            if self._player in hit_players:
                 match (type(powup)):
                     case burst_shot_powerup.BurstShotPowerup:
                         self._player.set_powerup("burst", powup.maxtime)
 
-                if powup in self._powerups:
-                    self._powerups.remove(powup)
-            if self._player2 and powup.rect.colliderect(self._player2.rect):
+                self._powerups.kill(powup)
+            if self._player2 and self._player2 in hit_players:
                 match (type(powup)):
                     case burst_shot_powerup.BurstShotPowerup:
                         self._player2.set_powerup("burst", powup.maxtime)
 
-                if powup in self._powerups:
-                    self._powerups.remove(powup)
+                self._powerups.kill(powup)
+        if timer is not None:
+            timer.mark("powerups")
+
+        self._compact_entities()
+        if timer is not None:
+            timer.mark("compact")
+
+    def _compact_entities(self):
+        """drop everything that died this frame, once, at the end of it"""
+
+        self._bullets.cull()
+        for enemy in self._enemies.compact():
+            self._pool.release(enemy)
+        for explosion in self._explosions.compact():
+            self._pool.release(explosion)
+        for obstacle in self._obstacles.compact():
+            self._pool.release(obstacle)
+        for powup in self._powerups.compact():
+            self._pool.release(powup)
 
     def player_shoot(self, player, override=False):
         if player is not None and not player.is_dead:
-            keys = pygame.key.get_pressed()
-
-            current_time = int((time.time() - self._timestart) * 1000)
+            current_time = int(self.elapsed() * 1000)
             if (override
-                or (keys[pygame.K_SPACE]
+                or (self._fire_held
                     and current_time % 250 < 125
                     and current_time - self._lastshot >= 250)
                 ):
-                    self._lastshot = int((time.time() - self._timestart) * 1000)
+                    self._lastshot = current_time
                     match (player.powerup):
                         case "burst":
                             (_, height) = self._screen.get_size()
 
                             bullet_asset = self._sprite_dict["playerbullet"]
 
-                            newpos = pygame.math.Vector2(
-                                player.position.x + (player.width // 2) - (bullet_asset.get_width() // 2), player.position.y
-                            )
-                            bullet_target = newpos - pygame.math.Vector2(0, height)
-                            self._bullets.append(
-                                bullets.PlayerBulletOneThird(newpos, bullet_target, self._player_bullet_speed - 0, bullet_asset)
+                            newpos = (player.position.x + (player.width // 2) - (bullet_asset.get_width() // 2), player.position.y)
+                            bullet_target = (newpos[0], newpos[1] - height)
+                            self._bullets.spawn(
+                                bullets.PlayerBulletOneThird, newpos, bullet_target, self._player_bullet_speed - 0, bullet_asset
                             )
-                            self._bullets.append(
-                                bullets.PlayerBulletOneThird(newpos, bullet_target, self._player_bullet_speed - 2, bullet_asset)
+                            self._bullets.spawn(
+                                bullets.PlayerBulletOneThird, newpos, bullet_target, self._player_bullet_speed - 2, bullet_asset
                             )
-                            self._bullets.append(
-                                bullets.PlayerBulletOneThird(newpos, bullet_target, self._player_bullet_speed - 4, bullet_asset)
+                            self._bullets.spawn(
+                                bullets.PlayerBulletOneThird, newpos, bullet_target, self._player_bullet_speed - 4, bullet_asset
                             )
 
                         case _:
@@ -584,49 +746,86 @@ class Level0(Scene):
 
                             bullet_asset = self._sprite_dict["playerbullet"]
 
-                            newpos = pygame.math.Vector2(
-                                player.position.x + + (player.width // 2) - (bullet_asset.get_width() // 2), player.position.y
-                            )
-                            bullet_target = newpos - pygame.math.Vector2(0, height)
+                            newpos = (player.position.x + (player.width // 2) - (bullet_asset.get_width() // 2), player.position.y)
+                            bullet_target = (newpos[0], newpos[1] - height)
                             velocity = self._player_bullet_speed
-                            self._bullets.append(
-                                bullets.PlayerBullet(newpos, bullet_target, velocity, bullet_asset)
+                            self._bullets.spawn(
+                                bullets.PlayerBullet, newpos, bullet_target, velocity, bullet_asset
                             )
 
 
-    def player_move(self, player, joystick, event):
-        try:
+    def _bind_controls(self):
+        """build the table that routes input events to the players"""
 
-            if player is not None and not player.is_dead:
-                if (
-                    (
-                    event.type == pygame.KEYDOWN
-                    and event.key == pygame.K_SPACE
-                    or event.type == pygame.JOYBUTTONDOWN
-                    and (event.button == 0
-                    or event.button == 7
-                    or event.button == 6)
-                    and event.instance_id == self._joysticks[joystick].get_instance_id()
-                    )
+        self._input = InputDispatcher()
 
-                ):
-                    self.player_shoot(player, override=True)
+        for key in (pygame.K_LEFT, pygame.K_a):
+            self._input.bind(pygame.KEYDOWN, key, self._on_move_left, 0)
+            self._input.bind(pygame.KEYUP, key, self._on_stop, 0)
+        for key in (pygame.K_RIGHT, pygame.K_d):
+            self._input.bind(pygame.KEYDOWN, key, self._on_move_right, 0)
+            self._input.bind(pygame.KEYUP, key, self._on_stop, 0)
+
+        self._input.bind(pygame.KEYDOWN, pygame.K_SPACE, self._on_fire, 0)
+        self._input.bind(pygame.KEYDOWN, pygame.K_SPACE, self._on_fire, 1)
+        self._input.bind(pygame.KEYDOWN, pygame.K_SPACE, self._on_hold_fire, 0)
+        self._input.bind(pygame.KEYUP, pygame.K_SPACE, self._on_release_fire, 0)
+        for button in (0, 6, 7):
+            self._input.bind(pygame.JOYBUTTONDOWN, button, self._on_fire)
 
-                if self._joysticks:
-                    axis = self._joysticks[joystick].get_axis(0)
+        self._input.bind(pygame.JOYAXISMOTION, 0, self._on_axis)
 
-                    if -0.1 < axis < 0.1:
-                        axis = 0
+        self._input.set_joysticks(self._joysticks)
 
+    def _get_player(self, number):
+        """get a living player by number, or None"""
 
-                    if axis > 0.1:
-                        player.move_right(axis)
-                    if axis < -0.1:
-                        player.move_left(axis)
-                    if axis == 0:
-                        player.stop()
-        except IndexError as e:
-            print("Exception encountered. Trying not to crash the thread.")
+        plyr = self._player if number == 0 else self._player2 if number == 1 else None
+
+        return plyr if plyr is not None and not plyr.is_dead else None
+
+    def _on_move_left(self, number, _event):
+        plyr = self._get_player(number)
+        if plyr is not None:
+            plyr.move_left()
+
+    def _on_move_right(self, number, _event):
+        plyr = self._get_player(number)
+        if plyr is not None:
+            plyr.move_right()
+
+    def _on_stop(self, number, _event):
+        plyr = self._get_player(number)
+        if plyr is not None:
+            plyr.stop()
+
+    def _on_fire(self, number, _event):
+        plyr = self._get_player(number)
+        if plyr is not None:
+            self.player_shoot(plyr, override=True)
+
+    def _on_hold_fire(self, _number, _event):
+        self._fire_held = True
+
+    def _on_release_fire(self, _number, _event):
+        self._fire_held = False
+
+    def _on_axis(self, number, event):
+        plyr = self._get_player(number)
+        if plyr is None:
+            return
+
+        axis = event.value
+
+        if -0.1 < axis < 0.1:
+            axis = 0
+
+        if axis > 0.1:
+            plyr.move_right(axis)
+        if axis < -0.1:
+            plyr.move_left(axis)
+        if axis == 0:
+            plyr.stop()
 
     def process_event(self, event):
         super().process_event(event)
@@ -638,23 +837,9 @@ class Level0(Scene):
                 or
                 event.type == pygame.JOYDEVICEREMOVED):
                 self._make_player2()
+                self._input.set_joysticks(self._joysticks)
 
-            t1 = threading.Thread(target=self.player_move, args=(self._player, 0, event))
-            t2 = threading.Thread(target=self.player_move, args=(self._player2, 1, event))
-
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_LEFT or event.key == pygame.K_a):
-                self._player.move_left()
-            elif event.type == pygame.KEYUP and (event.key == pygame.K_LEFT or event.key == pygame.K_a):
-                self._player.stop()
-            elif event.type == pygame.KEYDOWN and (event.key == pygame.K_RIGHT or event.key == pygame.K_d):
-                self._player.move_right()
-            elif event.type == pygame.KEYUP and (event.key == pygame.K_RIGHT or event.key == pygame.K_d):
-                self._player.stop()
-
-            t1.start()
-            t2.start()
-            t1.join()
-            t2.join()
+            self._input.dispatch(event)
 
     # pylint: disable=inconsistent-return-statements
     def end_scene(self):
@@ -671,58 +856,92 @@ class Level0(Scene):
         if not self._enemies:
             return ["CHANGE_SCENE", "LeaderboardScene"]
 
+    def dirty_rects(self):
+        """get the regions the last draw changed, or None for everything"""
+
+        if self._renderer is None:
+            return None
+
+        return self._renderer.end()
+
+    def _canvas(self):
+        """get what sprites are drawn to: the dirty rect renderer or the screen"""
+
+        if self._renderer is not None and not (self._bg or self._stars):
+            return self._renderer
+
+        return self._screen
+
+    def entity_counts(self):
+        return {
+            "bullets": len(self._bullets),
+            "enemies": len(self._enemies),
+            "explosions": len(self._explosions),
+            "obstacles": len(self._obstacles),
+            }
+
+    def draw_perf_hud(self, perf_hud):
+        return perf_hud.draw(self._canvas(), self.entity_counts())
+
     def draw(self):
-        super().draw()
+        timer = self._phase_timer
+        if timer is not None:
+            timer.start()
+
+        canvas = self._canvas()
+        if canvas is self._renderer:
+            self._renderer.begin(self._background)
+        else:
+            super().draw()
+            if self._renderer is not None:
+                self._renderer.invalidate()
+
+        alpha = self._alpha
 
         if self._bg:
             bg_height = self._bg_img.get_height()
-            screen_height = self._screen.get_height()
-            if self._scroll_bg >= screen_height:
-                self._scroll_bg = 0
 
-            frame1_y = self._scroll_bg
-            frame2_y = self._scroll_bg - bg_height
+            frame1_y = self._scroll_position(self._scroll_bg, alpha)
+            frame2_y = frame1_y - bg_height
             self._screen.blit(self._bg_img, (0, frame1_y))
             self._screen.blit(self._bg_img, (0, frame2_y))
 
-            self._scroll_bg += self._bg_speed
-
 
         if self._stars and not self._bg:
             space_height = self._random_space.get_height()
-            screen_height = self._screen.get_height()
-            if self._scroll >= screen_height:
-                self._scroll = 0
 
-            frame1_y = self._scroll
-            frame2_y = self._scroll - space_height
+            frame1_y = self._scroll_position(self._scroll, alpha)
+            frame2_y = frame1_y - space_height
             self._screen.blit(self._random_space, (1, frame1_y))
             self._screen.blit(self._random_space, (1, frame2_y))
+        if timer is not None:
+            timer.mark("draw_background")
 
-            self._scroll = self._scroll + self._bg_speed
-
-        self._player.draw(self._screen)
+        self._player.draw(canvas, alpha)
         if self._player2:
-            self._player2.draw(self._screen)
+            self._player2.draw(canvas, alpha)
         for explosion in self._explosions:
             if not explosion.should_die:
-                explosion.draw(self._screen)
+                explosion.draw(canvas)
         for enemy in self._enemies:
             if not enemy.is_exploding:
-                enemy.draw(self._screen)
-        for bullet in self._bullets:
-            bullet.draw(self._screen)
+                enemy.draw(canvas, alpha)
+        self._bullets.draw(canvas, alpha)
         for powup in self._powerups:
-            powup.draw(self._screen)
+            powup.draw(canvas, alpha)
         for obstacle in self._obstacles:
-            obstacle.draw(self._screen)
+            obstacle.draw(canvas, alpha)
+        if timer is not None:
+            timer.mark("draw_sprites")
 
-        lives_y = self._score_surface.get_height() + 8
+        lives_y = self._score_text.get_height() + 8
         lives_x = 4
         lives_x2 = self._life_picture.get_width() + 8
-        lives_y2 = (self._lives_surface.get_height() // 2) + lives_y
+        lives_y2 = (self._lives_text.get_height() // 2) + lives_y
 
-        self._screen.blit(self._life_picture, (lives_x, lives_y))
-        self._screen.blit(self._lives_surface, (lives_x2, lives_y2))
+        canvas.blit(self._life_picture, (lives_x, lives_y))
+        self._lives_text.draw(canvas, (lives_x2, lives_y2))
 
-        self._screen.blit(self._score_surface, (4, 4))
+        self._score_text.draw(canvas, (4, 4))
+        if timer is not None:
+            timer.mark("draw_hud")
@@ -0,0 +1,60 @@
+"""A free list that recycles game objects instead of allocating new ones"""
+
+
+class ObjectPool:
+    """keeps released objects per class and hands them back out on acquire
+
+    Objects must have a reset method that takes the same arguments as
+    their __init__.
+    """
+
+    def __init__(self):
+        """initialize an empty pool"""
+
+        self._free = {}
+        self._allocated = 0
+        self._reused = 0
+        self._released = 0
+
+    def acquire(self, cls, *args):
+        """get an instance of cls, reusing a released one if possible"""
+
+        free = self._free.get(cls)
+        if free:
+            obj = free.pop()
+            obj.reset(*args)
+            self._reused += 1
+            return obj
+
+        self._allocated += 1
+        return cls(*args)
+
+    def release(self, obj):
+        """give an object back to the pool"""
+
+        self._free.setdefault(type(obj), []).append(obj)
+        self._released += 1
+
+    @property
+    def allocated(self):
+        """get the number of objects the pool had to create"""
+
+        return self._allocated
+
+    @property
+    def reused(self):
+        """get the number of times a released object was handed out"""
+
+        return self._reused
+
+    @property
+    def released(self):
+        """get the number of objects given back to the pool"""
+
+        return self._released
+
+    @property
+    def free(self):
+        """get the number of objects waiting to be reused"""
+
+        return sum(len(objs) for objs in self._free.values())
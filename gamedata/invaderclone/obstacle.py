@@ -1,18 +1,27 @@
 """An obstacle that descends from the top of the screen (like powerup)"""
 
-import pygame
-
 from .bullets import Bullet
 
 class Obstacle(Bullet):
     """Obstacle that descends from the screen"""
 
+    __slots__ = ()
+
     def __init__(self, position, target_position, speed, img):
         """initialize an instance of the obstacle"""
 
         super().__init__(position, target_position, speed)
 
         self._img = img
+        self._rect.size = img.get_size()
+
+    def reset(self, position, target_position, speed, img):
+        """reinitialize the obstacle in place so it can be reused"""
+
+        super().reset(position, target_position, speed)
+
+        self._img = img
+        self._rect.size = img.get_size()
 
     @property
     def height(self):
@@ -22,17 +31,7 @@ class Obstacle(Bullet):
     def width(self):
         return self._img.get_width()
 
-    @property
-    def rect(self):
-        """bounding rect"""
-
-        left = self._position.x
-        top = self._position.y
-        width = self._img.get_width()
-        height = self._img.get_height()
-        return pygame.Rect(left, top, width, height)
-
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.):
         """draw the powerup to the screen"""
 
-        screen.blit(self._img, self._position)
+        screen.blit(self._img, self.draw_position(alpha))
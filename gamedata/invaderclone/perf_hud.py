@@ -0,0 +1,114 @@
+"""An overlay showing where each frame's time went"""
+
+from collections import deque
+
+import pygame
+
+from . import rgbcolors
+
+
+GRAPH_FRAMES = 120
+GRAPH_HEIGHT = 48
+REFRESH_FRAMES = 10
+FONT_SIZE = 18
+PADDING = 4
+
+FRAME_PHASES = ("events", "update_scene", "draw", "hud", "display_update")
+
+
+class PerfHud:
+    """frame timings, a frame time graph and entity counts in a corner
+
+    The game loop times each frame with a PhaseTimer and hands it to
+    record. The numbers shown are the last finished frame's, since the
+    frame being drawn has not finished yet. Text is only rendered again
+    every REFRESH_FRAMES frames so it can be read and costs little.
+    """
+
+    def __init__(self, budget_ms, visible=False):
+        """initialize a hud that marks frames slower than budget_ms"""
+
+        self._budget_ms = budget_ms
+        self._visible = visible
+        self._history = deque(maxlen=GRAPH_FRAMES)
+        self._frame_phases = {}
+        self._scene_phases = {}
+        self._font = None
+        self._text = []
+        self._frames_until_refresh = 0
+
+    @property
+    def visible(self):
+        """is the hud shown"""
+
+        return self._visible
+
+    def toggle(self):
+        """show or hide the hud"""
+
+        self._visible = not self._visible
+        self._history.clear()
+        self._frames_until_refresh = 0
+
+    def record(self, frame_phases, scene_phases=None):
+        """take the seconds spent in each phase of a finished frame"""
+
+        self._frame_phases = frame_phases
+        self._scene_phases = scene_phases or {}
+        self._history.append(sum(frame_phases.values()) * 1000)
+
+    def draw(self, surface, entity_counts=None):
+        """draw the hud to the top right corner of surface"""
+
+        if self._font is None:
+            self._font = pygame.font.Font(None, FONT_SIZE)
+
+        if self._frames_until_refresh <= 0:
+            self._text = self._render_text(entity_counts or {})
+            self._frames_until_refresh = REFRESH_FRAMES
+        self._frames_until_refresh -= 1
+
+        line_height = self._font.get_linesize()
+        width = max([GRAPH_FRAMES] + [line.get_width() for line in self._text]) + 2 * PADDING
+        height = len(self._text) * line_height + GRAPH_HEIGHT + 3 * PADDING
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 176))
+
+        for num, line in enumerate(self._text):
+            panel.blit(line, (PADDING, PADDING + num * line_height))
+
+        self._draw_graph(panel, PADDING, height - PADDING - GRAPH_HEIGHT)
+
+        return surface.blit(panel, (surface.get_width() - width, 0))
+
+    def _render_text(self, entity_counts):
+        total = sum(self._frame_phases.values()) * 1000
+        lines = [f"frame {total:6.2f} ms / {self._budget_ms:.2f} ms"]
+        lines += [
+            f"  {phase:<15}{self._frame_phases[phase] * 1000:6.2f} ms"
+            for phase in FRAME_PHASES
+            if phase in self._frame_phases
+            ]
+        lines += [
+            f"    {phase:<13}{elapsed * 1000:6.2f} ms"
+            for phase, elapsed in self._scene_phases.items()
+            ]
+        if entity_counts:
+            lines.append("  ".join(f"{name} {count}" for name, count in entity_counts.items()))
+
+        return [self._font.render(line, True, rgbcolors.ghostwhite) for line in lines]
+
+    def _draw_graph(self, panel, left, top):
+        """one bar per frame; the line is the budget, the top twice it"""
+
+        scale = GRAPH_HEIGHT / (2 * self._budget_ms)
+        bottom = top + GRAPH_HEIGHT - 1
+
+        for num, frame_ms in enumerate(self._history):
+            bar = min(GRAPH_HEIGHT, max(1, round(frame_ms * scale)))
+            color = rgbcolors.red if frame_ms > self._budget_ms else rgbcolors.green
+            pygame.draw.line(panel, color, (left + num, bottom), (left + num, bottom - bar + 1))
+
+        budget_y = bottom - GRAPH_HEIGHT // 2
+        pygame.draw.line(panel, rgbcolors.yellow, (left, budget_y), (left + GRAPH_FRAMES - 1, budget_y))
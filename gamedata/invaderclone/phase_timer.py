@@ -0,0 +1,70 @@
+"""Times the phases of a frame"""
+
+import time
+
+
+class PhaseTimer:
+    """adds up the time spent in each named phase of a frame
+
+    start begins timing, and each mark ends the phase it names and begins
+    the next one. end_frame closes the frame, keeping its times as
+    last_frame.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """initialize a timer that reads the time from clock"""
+
+        self._clock = clock
+        self._started = clock()
+        self._current = {}
+        self._last_frame = {}
+        self._totals = {}
+        self._frames = 0
+
+    def start(self):
+        """begin timing the first phase"""
+
+        self._started = self._clock()
+
+    def mark(self, phase):
+        """end a phase, adding the time since the last mark to it"""
+
+        now = self._clock()
+        self._current[phase] = self._current.get(phase, 0.) + now - self._started
+        self._started = now
+
+    def end_frame(self):
+        """finish the current frame"""
+
+        for phase, elapsed in self._current.items():
+            self._totals[phase] = self._totals.get(phase, 0.) + elapsed
+
+        self._last_frame = self._current
+        self._current = {}
+        self._frames += 1
+
+    def reset(self):
+        """forget every frame timed so far"""
+
+        self._current = {}
+        self._last_frame = {}
+        self._totals = {}
+        self._frames = 0
+
+    @property
+    def last_frame(self):
+        """get the seconds spent in each phase of the last finished frame"""
+
+        return self._last_frame
+
+    @property
+    def totals(self):
+        """get the seconds spent in each phase over every finished frame"""
+
+        return self._totals
+
+    @property
+    def frames(self):
+        """get the number of finished frames"""
+
+        return self._frames
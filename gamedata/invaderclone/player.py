@@ -7,11 +7,12 @@ import pygame
 class Player:
     """A player."""
 
-    def __init__(self, position, screen, character, player_speed=15):
-        """initialize a player character"""
+    def __init__(self, position, screen, character, player_speed=15, clock=time.time):
+        """initialize a player character whose timers read seconds from clock"""
 
         self._width, self._height = screen.get_size()
         self._position = position
+        self._previous = position
         self._size = character.get_width()
         self._velocity = pygame.math.Vector2(0, 0)
         self.is_dead = False
@@ -19,20 +20,36 @@ class Player:
         self._sprite = character
         self._speed = player_speed
         self._moving = False
+        self._clock = clock
 
         self._powerup = None
         self._powerup_timer = 0
         self._powerup_max = 0
 
+        self._rect = pygame.Rect(int(position.x), int(position.y), self._size, self._size)
+
     def update(self):
         """update the posiition of the player"""
 
+        self._previous = self._position
         vel = self._position.x + self._velocity.x
         if 0 < vel < self._width - self._size:
             self._position = self._position + self._velocity
+            self._rect.x = int(self._position.x)
+            self._rect.y = int(self._position.y)
 
         _ = self.powered_up
 
+    def reset(self, position):
+        """bring the player back to life at a position, with no powerup"""
+
+        self.is_dead = False
+        self._invincible = 0
+        self._powerup = None
+        self._powerup_timer = 0
+        self._powerup_max = 0
+        self.position = position
+
     @property
     def width(self):
         """get the width of the player"""
@@ -55,7 +72,7 @@ class Player:
         if self._powerup_max < 0:
             return True
 
-        if self._powerup_timer + self._powerup_max < time.time():
+        if self._powerup_timer + self._powerup_max < self._clock():
             self._powerup = None
             self._powerup_timer = 0
             self._powerup_max = 0
@@ -67,7 +84,7 @@ class Player:
         """set the powerup"""
 
         self._powerup = name
-        self._powerup_timer = time.time()
+        self._powerup_timer = self._clock()
         self._powerup_max = max_time
 
 
@@ -84,7 +101,7 @@ class Player:
         if not self._invincible:
             return False
 
-        if self._invincible + 1 < time.time():
+        if self._invincible + 1 < self._clock():
             self._invincible = 0
             return False
 
@@ -93,7 +110,7 @@ class Player:
     def invincible_clock(self):
         """make the player invincible"""
 
-        self._invincible = time.time()
+        self._invincible = self._clock()
 
     @position.setter
     def position(self, value):
@@ -101,6 +118,9 @@ class Player:
 
         self.stop()
         self._position = value
+        self._previous = value
+        self._rect.x = int(value.x)
+        self._rect.y = int(value.y)
 
     @property
     def moving(self):
@@ -108,12 +128,9 @@ class Player:
 
     @property
     def rect(self):
-        """get the rect"""
+        """get the rect, updated in place as the player moves"""
 
-        left = self._position.x
-        top = self._position.y
-        width = self._size
-        return pygame.Rect(left, top, width, width)
+        return self._rect
 
     def stop(self):
         """Stop the player"""
@@ -139,8 +156,13 @@ class Player:
     def _move(self, vel):
         """move the player"""
         self._position = self._position + vel
+        self._rect.x = int(self._position.x)
+        self._rect.y = int(self._position.y)
 
-    def draw(self, screen):
-        """Draw the circle to a given screen"""
+    def draw(self, screen, alpha=1.):
+        """Draw the circle to a given screen, alpha of the way from the last position"""
         if not self.is_dead:
-            screen.blit(self._sprite, self._position)
+            if alpha >= 1.:
+                screen.blit(self._sprite, self._position)
+            else:
+                screen.blit(self._sprite, self._previous.lerp(self._position, alpha))
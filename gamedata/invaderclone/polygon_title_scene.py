@@ -5,6 +5,8 @@ import pygame
 from .press_any_key_to_exit_scene import PressAnyKeyToExitScene
 from . import rgbcolors
 from . import theme
+from . import surface_cache
+from . import font_registry
 
 class PolygonTitleScene(PressAnyKeyToExitScene):
     """Scene with a title string and a polygon."""
@@ -28,10 +30,17 @@ class PolygonTitleScene(PressAnyKeyToExitScene):
         self._title_img = None
         self.update_settings()
 
-    def reset_scene(self):
-        super().reset_scene()
+    @classmethod
+    def font_requests(cls, scene_theme, screen_height):
+        title_font = scene_theme.get("titlefont", theme.FALLBACK_FNT)
+        pixel_font = scene_theme.get("pixelfont", theme.FALLBACK_FNT)
 
-        self.__init__(self._screen, self._game_settings)
+        return {
+            "title": (title_font, screen_height // 11),
+            "subtitle": (title_font, screen_height // 50),
+            "string": (pixel_font, screen_height // 44),
+            "subpixel": (pixel_font, screen_height // 47),
+            }
 
     def update_settings(self, new_settings = None):
         super().update_settings()
@@ -51,19 +60,14 @@ class PolygonTitleScene(PressAnyKeyToExitScene):
         if PAK_COLOR is None:
             PAK_COLOR = cd[gs["title_text_color"]]
 
-        screen_height = self._screen.get_height()
-
-        title_modded_size = screen_height // 11
-        subtitle_size = screen_height // 50
-        string_size = screen_height // 44
-        subpixel_size = screen_height // 47
-
-        title_font = pygame.font.Font(self._theme.get("titlefont", theme.FALLBACK_FNT), title_modded_size)
-
-        subtitle_font = pygame.font.Font(self._theme.get("titlefont", theme.FALLBACK_FNT), subtitle_size)
-
-        string_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), string_size)
-        subpixel_font = pygame.font.Font(self._theme.get("pixelfont", theme.FALLBACK_FNT), subpixel_size)
+        fonts = {
+            name: font_registry.get(*request)
+            for name, request in self.font_requests(self._theme, self._screen.get_height()).items()
+            }
+        title_font = fonts["title"]
+        subtitle_font = fonts["subtitle"]
+        string_font = fonts["string"]
+        subpixel_font = fonts["subpixel"]
 
 
         TITLE = gs["name"] if gs["alt_title"] is None else gs["alt_title"]
@@ -94,9 +98,12 @@ class PolygonTitleScene(PressAnyKeyToExitScene):
         _, height = self._screen.get_size()
         img_size = height // 8
 
-        img = pygame.image.load(self._theme.get("title_icon", theme.FALLBACK_IMG)).convert_alpha()
+        self._title_img = surface_cache.load(self._theme.get("title_icon", theme.FALLBACK_IMG), (img_size, img_size))
 
-        self._title_img = pygame.transform.scale(img, (img_size, img_size))
+    def update_scene(self):
+        """Open a font queued by font_registry.preload, one per frame."""
+        super().update_scene()
+        font_registry.get_registry().load_pending()
 
     def draw(self):
         """Draw the scene."""
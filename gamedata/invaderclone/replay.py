@@ -0,0 +1,145 @@
+"""Records the input of a game session so it can be played back"""
+
+import json
+
+import pygame
+
+
+FORMAT_VERSION = 1
+
+RECORDED_EVENTS = frozenset((
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+    ))
+
+# settings that change how a replay is watched, not what happens in it
+VIEWING_SETTINGS = frozenset((
+    "record", "replay", "replay_speed",
+    "headless", "skip_draw", "perf_hud", "dirty_rects", "frame_rate", "max_ticks",
+    ))
+
+
+def _encode(value):
+    """get a JSON version of a setting or event attribute, or raise TypeError"""
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+
+    raise TypeError(f"cannot record {type(value).__name__}")
+
+
+def _encode_event(event):
+    attributes = {}
+    for name, value in event.dict.items():
+        try:
+            attributes[name] = _encode(value)
+        except TypeError:
+            continue
+
+    return [event.type, attributes]
+
+
+def _decode_event(record):
+    event_type, attributes = record
+
+    return pygame.event.Event(event_type, {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in attributes.items()
+        })
+
+
+class ReplayRecorder:
+    """writes the settings of a game, then the input of each frame
+
+    A replay file is JSON lines. The first holds the settings, seed
+    included, and every line after it is one frame: the number of game
+    updates run and the input events handed to the scene before them.
+    With the settings, the seed and tick based scene clocks, that is
+    enough to play the session again update for update.
+    """
+
+    def __init__(self, filename, game_settings):
+        """initialize a recorder writing to filename"""
+
+        self._file = open(filename, "w", encoding="utf-8")
+        settings = {}
+        for key, value in game_settings.items():
+            if key in VIEWING_SETTINGS:
+                continue
+            try:
+                settings[key] = _encode(value)
+            except TypeError:
+                continue
+
+        self._write({
+            "format": FORMAT_VERSION,
+            "pygame": pygame.version.ver,
+            "settings": settings,
+            })
+
+    def record(self, ticks, events):
+        """record a frame's game updates and input events"""
+
+        self._write([ticks, [
+            _encode_event(event)
+            for event in events
+            if event.type in RECORDED_EVENTS
+            ]])
+
+    def close(self):
+        """finish the replay file"""
+
+        self._file.close()
+
+    def _write(self, line):
+        self._file.write(json.dumps(line, separators=(",", ":")))
+        self._file.write("\n")
+
+
+class ReplayPlayer:
+    """reads back a replay file a frame at a time"""
+
+    def __init__(self, filename):
+        """initialize a player reading filename"""
+
+        self._file = open(filename, "r", encoding="utf-8")
+        header = json.loads(self._file.readline())
+        if header.get("format") != FORMAT_VERSION:
+            self._file.close()
+            raise ValueError(f"{filename} is not a version {FORMAT_VERSION} replay")
+
+        self._settings = header["settings"]
+
+    def apply_settings(self, game_settings):
+        """replace game_settings with the recorded ones, keeping how it is watched"""
+
+        for key, value in self._settings.items():
+            if key not in VIEWING_SETTINGS:
+                game_settings[key] = value
+
+    def next_frame(self):
+        """get the next frame's (game updates, events), or None at the end"""
+
+        line = self._file.readline()
+        if not line.endswith("\n"):
+            return None
+
+        ticks, events = json.loads(line)
+
+        return ticks, [_decode_event(event) for event in events]
+
+    def close(self):
+        """stop reading the replay file"""
+
+        self._file.close()
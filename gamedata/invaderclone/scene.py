@@ -1,16 +1,15 @@
 """Scene objects for making games with PyGame."""
 
 from sys import platform
-from os import path, makedirs
-import time
+import random
 
 import pygame
 
 from . import rgbcolors
 from . import theme
+from . import theme_pack
 from . import leaderboard
 
-from .constants import save_path, file_name
 
 # pylint: disable=too-many-instance-attributes
 class Scene:
@@ -27,25 +26,45 @@ class Scene:
         #self._background.fill(self._game_settings["default_bg"])
         self._frame_rate = self._game_settings["frame_rate"]
         self._is_valid = True
+        self._alpha = 1.
+        self._phase_timer = None
         self._soundtrack = self._theme.get(soundtrack, theme.FALLBACK_SND)
         self._quit = False
-        self._timestart = time.time()
+        self._tick_rate = max(1, self._game_settings["tick_rate"])
+        self._ticks = 0
+        seed = self._game_settings["seed"]
+        self._random = random.Random(None if seed is None else f"{seed}:{type(self).__name__}")
 
 
         self._joysticks = None
 
         self._make_joysticks()
 
-        if not path.exists(save_path):
-            makedirs(save_path)
-        if not path.exists(file_name):
-            leaderboard.Leaderboard().save(save_path)
-
-        self._leaderboard = leaderboard.\
-            create_leaderboard_from_pickle(file_name)
+        self._leaderboard = leaderboard.get_leaderboard()
 
     def reset_scene(self):
-        self.__init__(self._screen, self._game_settings)
+        """Get the scene ready to be played again."""
+        self.reset_state()
+
+    def theme_is_current(self):
+        """Return whether the scene's theme still matches the one on disk."""
+        return self._theme.is_current()
+
+    def load_resources(self):
+        """Load what the scene keeps for its whole life, such as sounds.
+
+        Subclasses call this once, from __init__.
+        """
+
+    def reset_state(self):
+        """Restore the state a new scene starts in.
+
+        This runs whenever the scene is reset, so it only resets fields and
+        never loads anything. Subclasses also call it at the end of __init__.
+        """
+        self._is_valid = True
+        self._quit = False
+        self._ticks = 0
 
     def _make_joysticks(self):
         """make a list of joysticks"""
@@ -58,12 +77,47 @@ class Scene:
     def clock(self):
         """Reset the scene clock."""
 
-        self._timestart = time.time()
+        self._ticks = 0
+
+    def tick(self):
+        """Advance the scene clock by one game update."""
+
+        self._ticks += 1
+
+    def elapsed(self):
+        """Return the seconds of game time since the scene clock was reset."""
+
+        return self._ticks / self._tick_rate
+
+    def seed(self, value):
+        """Seed the random numbers the scene uses."""
+
+        self._random.seed(value)
 
     def draw(self):
         """Draw the scene."""
         self._screen.blit(self._background, (0, 0))
 
+    def set_phase_timer(self, phase_timer):
+        """Time the phases of update_scene and draw with a PhaseTimer, or None."""
+        self._phase_timer = phase_timer
+
+    def entity_counts(self):
+        """Return the number of each kind of entity, for the perf hud."""
+        return {}
+
+    def draw_perf_hud(self, perf_hud):
+        """Draw the perf hud over the scene, returning the rect it covers."""
+        return perf_hud.draw(self._screen, self.entity_counts())
+
+    def set_interpolation(self, alpha):
+        """Set how far between the last two updates the next draw is."""
+        self._alpha = alpha
+
+    def dirty_rects(self):
+        """Return the regions the last draw changed, or None for all."""
+        return None
+
     def process_event(self, event):
         """Process a game event by the scene."""
         if event.type == pygame.QUIT:
@@ -88,6 +142,15 @@ class Scene:
     def update_scene(self):
         pass
 
+    @classmethod
+    def font_requests(cls, scene_theme, screen_height):
+        """Return {name: (font file, size)} for the fonts the scene uses."""
+        return {}
+
+    def settings_keys(self):
+        """Return the settings update_settings reads, or None for all."""
+        return None
+
     def update_settings(self, new_settings = None):
         gs = self._game_settings if new_settings is None else new_settings
         self._frame_rate = gs["frame_rate"]
@@ -96,7 +159,7 @@ class Scene:
         """Start the scene."""
         if self._soundtrack:
             try:
-                pygame.mixer.music.load(self._soundtrack)
+                pygame.mixer.music.load(theme_pack.resolve(self._soundtrack))
                 pygame.mixer.music.set_volume(0.2)
             except pygame.error as pygame_error:
                 print("Cannot open the mixer?")
@@ -0,0 +1,70 @@
+"""Creates scenes the first time they are needed"""
+
+from collections.abc import Mapping
+
+from .scene import Scene
+
+
+class SceneRegistry(Mapping):
+    """a read-only mapping of scene names to scenes, built on first use
+
+    Each name is registered with a factory that takes no arguments and
+    returns the scene. Looking a name up calls its factory once and keeps
+    the scene for later lookups; invalidate drops kept scenes so their
+    factories run again the next time they are needed. Checking if a
+    name is in the registry, or iterating over it, never creates a scene.
+    """
+
+    def __init__(self):
+        """initialize a registry with no scenes"""
+
+        self._factories = {}
+        self._scenes = {}
+        self._created = 0
+
+    def register(self, name, factory):
+        """make factory() the way to create the scene called name"""
+
+        self._factories[name] = factory
+        self._scenes.pop(name, None)
+
+    def __getitem__(self, name):
+        scene = self._scenes.get(name)
+        if scene is None:
+            scene = self._factories[name]()
+            if not isinstance(scene, Scene):
+                raise TypeError(f"the factory for {name} made a {type(scene).__name__}, not a Scene")
+            self._scenes[name] = scene
+            self._created += 1
+
+        return scene
+
+    def __contains__(self, name):
+        return name in self._factories
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+    def is_created(self, name):
+        """check if the scene called name has been created and kept"""
+
+        return name in self._scenes
+
+    def invalidate(self, names=None):
+        """drop the kept scenes called names, or all of them"""
+
+        if names is None:
+            self._scenes.clear()
+            return
+
+        for name in names:
+            self._scenes.pop(name, None)
+
+    @property
+    def created(self):
+        """get the number of scenes the registry has created"""
+
+        return self._created
@@ -0,0 +1,188 @@
+"""Crash-safe leaderboard storage that running games can share"""
+
+import json
+import os
+import pickle
+import uuid
+
+from contextlib import contextmanager
+from os import path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+MAX_SCORES = 10
+COMPACT_AFTER = 64
+
+SNAPSHOT_NAME = "scores.snapshot"
+JOURNAL_NAME = "scores.journal"
+LOCK_NAME = "scores.lock"
+PICKLE_NAME = "scores.pkle"
+
+
+@contextmanager
+def _locked(lock_filename, exclusive=True):
+    """hold an advisory lock on a file for the duration of a with block"""
+
+    with open(lock_filename, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _top(entries):
+    """keep the best MAX_SCORES entries, each id once, best first"""
+
+    unique = {entry[2]: entry for entry in entries}
+
+    return sorted(unique.values(), key=lambda e: e[0], reverse=True)[:MAX_SCORES]
+
+
+class ScoreJournal:
+    """scores kept in a snapshot plus an append-only journal
+
+    A new score is one line appended to the journal under an exclusive
+    lock, so games running at the same time add to each other's scores
+    instead of overwriting them. A line cut short by a crash is ignored.
+    Once the journal holds COMPACT_AFTER scores, the best are written to a
+    new snapshot that atomically replaces the old one and the journal is
+    emptied. Every score has an id, so a crash between those two steps
+    cannot count a score twice. Loading reads at most MAX_SCORES snapshot
+    entries and COMPACT_AFTER journal lines, however long the game has
+    been played.
+
+    The first time a directory is used, the scores from the old pickle
+    file are imported if it was written by this leaderboard version.
+    """
+
+    def __init__(self, directory, version_name):
+        """initialize a journal kept in a directory"""
+
+        self._directory = directory
+        self._version_name = version_name
+        self._snapshot = path.join(directory, SNAPSHOT_NAME)
+        self._journal = path.join(directory, JOURNAL_NAME)
+        self._lock = path.join(directory, LOCK_NAME)
+
+    def load(self):
+        """get the best scores as (score, date) pairs, best first"""
+
+        self._prepare()
+
+        with _locked(self._lock, exclusive=False):
+            entries, _ = self._read()
+
+        return [(entry[0], entry[1]) for entry in entries]
+
+    def append(self, score):
+        """record a (score, date) pair, returning the best scores after it"""
+
+        self._prepare()
+
+        line = json.dumps([score[0], score[1], uuid.uuid4().hex]) + "\n"
+
+        with _locked(self._lock):
+            with open(self._journal, "a+b") as journal:
+                journal.seek(0, os.SEEK_END)
+                if journal.tell():
+                    journal.seek(-1, os.SEEK_END)
+                    if journal.read(1) != b"\n":
+                        line = "\n" + line
+                journal.write(line.encode("utf-8"))
+                journal.flush()
+                os.fsync(journal.fileno())
+
+            entries, journal_length = self._read()
+            if journal_length >= COMPACT_AFTER:
+                self._write_snapshot(entries)
+                with open(self._journal, "wb"):
+                    pass
+
+        return [(entry[0], entry[1]) for entry in entries]
+
+    def _prepare(self):
+        if path.exists(self._snapshot):
+            return
+
+        if not path.exists(self._directory):
+            os.makedirs(self._directory)
+
+        with _locked(self._lock):
+            if not path.exists(self._snapshot):
+                self._write_snapshot(self._import_pickle())
+
+    def _import_pickle(self):
+        pickle_filename = path.join(self._directory, PICKLE_NAME)
+        if not path.exists(pickle_filename):
+            return []
+
+        try:
+            with open(pickle_filename, "rb") as handle:
+                leader = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return []
+
+        if getattr(leader, "version_name", None) != self._version_name:
+            return []
+
+        return _top(
+            [score, date, f"pickle-{num}"]
+            for num, (score, date) in enumerate(leader.scores)
+            )
+
+    def _read(self):
+        """get the best entries and the number of scores in the journal"""
+
+        with open(self._snapshot, "r", encoding="utf-8") as snapshot:
+            entries = json.load(snapshot)["scores"]
+
+        journal_length = 0
+        if path.exists(self._journal):
+            with open(self._journal, "rb") as journal:
+                for line in journal:
+                    if not line.endswith(b"\n"):
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    entries.append(entry)
+                    journal_length += 1
+
+        return _top(entries), journal_length
+
+    def _write_snapshot(self, entries):
+        temp_filename = f"{self._snapshot}.{os.getpid()}.tmp"
+
+        with open(temp_filename, "w", encoding="utf-8") as snapshot:
+            json.dump({"version_name": self._version_name, "scores": entries}, snapshot)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+
+        os.replace(temp_filename, self._snapshot)
+
+        if fcntl is not None:
+            directory = os.open(self._directory, os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
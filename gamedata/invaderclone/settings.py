@@ -0,0 +1,122 @@
+"""A settings dictionary that keeps track of what changed"""
+
+
+class GameSettings(dict):
+    """game settings with a version that goes up on every change
+
+    Each key also remembers the version it last changed at, and callbacks
+    can subscribe to changes of some or all keys. Only assignments and
+    deletions are seen, so a list or dict held in a setting has to be
+    replaced, not changed in place, for anyone to notice.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """initialize settings like a dict, at version 0"""
+
+        super().__init__(*args, **kwargs)
+        self._version = 0
+        self._key_versions = {}
+        self._subscribers = []
+
+    def __setitem__(self, key, value):
+        if key in self and super().__getitem__(key) == value:
+            return
+
+        super().__setitem__(key, value)
+        self._changed(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed(key, None)
+
+    def __ior__(self, other):
+        self.update(other)
+
+        return self
+
+    def update(self, *args, **kwargs):
+        """set many settings at once"""
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        """get a setting, setting it to default first if missing"""
+
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def pop(self, key, *default):
+        """remove a setting and return its value"""
+
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key:
+            self._changed(key, None)
+
+        return value
+
+    def popitem(self):
+        """remove the last setting and return it as a (key, value) pair"""
+
+        key, value = super().popitem()
+        self._changed(key, None)
+
+        return key, value
+
+    def clear(self):
+        """remove every setting"""
+
+        for key in list(self):
+            del self[key]
+
+    @property
+    def version(self):
+        """get a number that goes up whenever any setting changes"""
+
+        return self._version
+
+    def key_version(self, key):
+        """get the version a setting last changed at, or 0 if it never has"""
+
+        return self._key_versions.get(key, 0)
+
+    def changed_since(self, version, keys=None):
+        """check if any of some settings, or any at all, changed after a version"""
+
+        if self._version <= version:
+            return False
+
+        if keys is None:
+            return True
+
+        return any(self._key_versions.get(key, 0) > version for key in keys)
+
+    def subscribe(self, callback, keys=None):
+        """call callback(key, value) whenever one of keys, or any key, changes
+
+        A deleted setting is reported with a value of None.
+        """
+
+        self._subscribers.append((callback, None if keys is None else frozenset(keys)))
+
+        return callback
+
+    def unsubscribe(self, callback):
+        """stop calling a subscribed callback"""
+
+        self._subscribers = [
+            (subscriber, keys)
+            for subscriber, keys in self._subscribers
+            if subscriber != callback
+            ]
+
+    def _changed(self, key, value):
+        self._version += 1
+        self._key_versions[key] = self._version
+
+        for callback, keys in list(self._subscribers):
+            if keys is None or key in keys:
+                callback(key, value)
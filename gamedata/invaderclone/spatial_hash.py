@@ -0,0 +1,116 @@
+"""A uniform grid for finding which objects a rect collides with"""
+
+
+class SpatialHash:
+    """buckets objects into square cells by the rects they cover"""
+
+    def __init__(self, cell_size):
+        """initialize an empty spatial hash"""
+
+        self._cell_size = max(1, int(cell_size))
+        self._cells = {}
+        self._entries = {}
+        self._order = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return obj in self._entries
+
+    @property
+    def cell_size(self):
+        """get the width and height of a cell"""
+
+        return self._cell_size
+
+    def _cells_for(self, rect):
+        """get the cells a rect covers"""
+
+        size = self._cell_size
+        left = rect.left // size
+        right = (rect.right - 1) // size
+        top = rect.top // size
+        bottom = (rect.bottom - 1) // size
+
+        return [
+            (i, j)
+            for i in range(left, right + 1)
+            for j in range(top, bottom + 1)
+            ]
+
+    def clear(self):
+        """remove everything from the hash"""
+
+        self._cells.clear()
+        self._entries.clear()
+        self._order = 0
+
+    def rebuild(self, objs):
+        """clear the hash, then insert every object in order"""
+
+        self.clear()
+        for obj in objs:
+            self.insert(obj)
+
+    def insert(self, obj, rect=None):
+        """insert an object, or move it if it is already in the hash
+
+        The rect is kept as is rather than copied, so an object has to be
+        inserted again after its rect moves.
+        """
+
+        rect = obj.rect if rect is None else rect
+
+        if obj in self._entries:
+            order = self._entries[obj][1]
+            self.remove(obj)
+        else:
+            order = self._order
+            self._order += 1
+
+        cells = self._cells_for(rect)
+        self._entries[obj] = (rect, order, cells)
+
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                self._cells[cell] = [obj]
+            else:
+                bucket.append(obj)
+
+    def remove(self, obj):
+        """remove an object from the hash if it is in it"""
+
+        entry = self._entries.pop(obj, None)
+        if entry is None:
+            return
+
+        for cell in entry[2]:
+            bucket = self._cells[cell]
+            bucket.remove(obj)
+            if not bucket:
+                del self._cells[cell]
+
+    def query(self, rect):
+        """get every object colliding with rect, in insertion order"""
+
+        found = set()
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                found.update(bucket)
+
+        entries = self._entries
+        hits = [obj for obj in found if rect.colliderect(entries[obj][0])]
+        if len(hits) > 1:
+            hits.sort(key=lambda obj: entries[obj][1])
+
+        return hits
+
+    def collide(self, rect):
+        """get the first object colliding with rect, like Rect.collidelist"""
+
+        hits = self.query(rect)
+
+        return hits[0] if hits else None
@@ -0,0 +1,153 @@
+"""A process-wide cache of decoded and scaled images"""
+
+from collections import OrderedDict
+from os import path
+
+import pygame
+
+from . import theme_pack
+
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """surfaces keyed by (path, size, alpha), evicted least recently used
+
+    Surfaces handed out are shared by everyone who loads the same key, so
+    callers must copy one before drawing on it.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """initialize an empty cache holding at most budget bytes"""
+
+        self._surfaces = OrderedDict()
+        self._budget = budget
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def load(self, filename, size=None, alpha=True):
+        """get the image at filename, scaled to size if given
+
+        With alpha the image is converted with convert_alpha, which needs
+        a display mode to have been set; without it the image is returned
+        as decoded.
+        """
+
+        key = (path.realpath(filename), None if size is None else tuple(size), alpha)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+
+        if size is None:
+            surface = theme_pack.load_image(key[0])
+            if alpha:
+                surface = surface.convert_alpha()
+        else:
+            surface = pygame.transform.scale(self.load(key[0], None, alpha), key[1])
+
+        self._store(key, surface)
+
+        return surface
+
+    def _store(self, key, surface):
+        self._surfaces[key] = surface
+        self._bytes += _surface_bytes(surface)
+        self._trim(keep=1)
+
+    def _trim(self, keep=0):
+        while self._bytes > self._budget and len(self._surfaces) > keep:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._bytes -= _surface_bytes(evicted)
+            self._evictions += 1
+
+    def forget(self, directory):
+        """drop the surfaces loaded from files, or pack members, within directory"""
+
+        directory = path.realpath(directory)
+        for key in [key for key in self._surfaces if theme_pack.is_within(key[0], directory)]:
+            self._bytes -= _surface_bytes(self._surfaces.pop(key))
+
+    def clear(self):
+        """drop every cached surface"""
+
+        self._surfaces.clear()
+        self._bytes = 0
+
+    @property
+    def budget(self):
+        """get the most bytes the cache will hold"""
+
+        return self._budget
+
+    @budget.setter
+    def budget(self, val):
+        """set the most bytes the cache will hold, evicting if needed"""
+
+        self._budget = val
+        self._trim()
+
+    @property
+    def bytes(self):
+        """get the bytes of pixel data currently cached"""
+
+        return self._bytes
+
+    @property
+    def hits(self):
+        """get the number of loads answered from the cache"""
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """get the number of loads that had to decode or scale"""
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """get the number of surfaces dropped to stay under budget"""
+
+        return self._evictions
+
+    def stats(self):
+        """get the cache statistics as a dictionary"""
+
+        return {
+            "surfaces": len(self._surfaces),
+            "bytes": self._bytes,
+            "budget": self._budget,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            }
+
+
+_CACHE = SurfaceCache()
+
+
+def get_cache():
+    """get the cache shared by every scene"""
+
+    return _CACHE
+
+
+def load(filename, size=None, alpha=True):
+    """load an image through the shared cache"""
+
+    return _CACHE.load(filename, size, alpha)
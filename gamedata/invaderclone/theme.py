@@ -2,11 +2,17 @@
 
 import errno
 
-from os import path, makedirs, strerror
+from os import path, makedirs, stat, strerror
 from sys import platform
 from glob import glob
+from collections import namedtuple
+from types import MappingProxyType
 
 from .constants import SETTINGS_DIR, DATA_DIR
+from . import font_registry
+from . import hud_text
+from . import surface_cache
+from . import theme_pack
 
 # missing.png created by ganelon, but inspired by the Source Engine's fallback texture.
 FALLBACK_IMG = path.join(DATA_DIR, "missing.png")
@@ -18,67 +24,179 @@ FALLBACK_SND = path.join(DATA_DIR, "missing.wav")
 FALLBACK_FNT = path.join(DATA_DIR, "curs.ttf")
 
 def get_theme_dir(name):
+    """Get the directory of a theme, or the file of a theme pack"""
+
     assets_path = path.join(DATA_DIR, "themes", name)
     config_path = path.join(SETTINGS_DIR, "themes", name)
 
-    if path.exists(config_path):
+    if theme_pack.is_pack(name) and path.isfile(name):
+        return path.realpath(name)
+    elif path.exists(config_path):
         return config_path
     elif path.exists(assets_path):
         return assets_path
 
-    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), f'niether {self._config_path} nor {self._assets_path}')
+    raise FileNotFoundError(errno.ENOENT, strerror(errno.ENOENT), f'niether {config_path} nor {assets_path}')
+
+_ASSET_DICTIONARY = {
+    "title_icon": path.join("images", "title.png"),
+    "gameover_icon": path.join("images", "gameover.png"),
+    "hero": path.join("images", "hero.png"),
+    "second_hero": path.join("images", "second_hero.png"),
+    "neko": path.join("images", "enemy.png"),
+    "titlefont": path.join("fonts", "title.ttf"),
+    "title_music" : path.join("bgm", "title.ogg"),
+    "leaderboard_music" : path.join("bgm", "leaderboard.ogg"),
+    "gameover_music" : path.join("bgm", "game_over.ogg"),
+    "game_music": path.join("bgm", "game.ogg"),
+    "explosion": path.join("images", "explosion.png"),
+    "explode": path.join("bgs", "explode.ogg"),
+    "explode+kitty": path.join("bgs", "explode+kitty.ogg"),
+    "pixelfont": path.join("fonts", "other.ttf"),
+    "ast1": path.join("images", "asteroid1.png"),
+    "ast2": path.join("images", "asteroid2.png"),
+    "burst": path.join("images", "burst.png"),
+    "playerbullet" : path.join("images", "goodbullet.png"),
+    "enemybullet" : path.join("images", "badbullet.png"),
+    "bg" : path.join("images", "bg.png")
+}
+
+# Every asset path a theme resolves to, found once per theme name.
+# assets maps each key to its file, or None when the theme lacks it.
+# For a theme pack the files are "<pack>::<member>" names. stamps holds
+# (file, mtime_ns, size) for every file found, or for the pack, so a
+# file edited in place changes the manifest too.
+Manifest = namedtuple("Manifest", ["dir", "assets", "enemies", "obstacles", "stamps"])
+
+_manifests = {}
+
+def _stamps(files):
+    stamps = []
+    for filename in files:
+        try:
+            info = stat(filename)
+        except OSError:
+            continue
+        stamps.append((filename, info.st_mtime_ns, info.st_size))
+
+    return tuple(stamps)
+
+def _build_pack_manifest(name):
+    pack = theme_pack.get_pack(get_theme_dir(name))
+
+    return Manifest(
+        pack.filename,
+        MappingProxyType({
+            key: pack.member_path(pack.assets[key]) if key in pack.assets else None
+            for key in _ASSET_DICTIONARY
+        }),
+        tuple(pack.member_path(member) for member in pack.enemies),
+        tuple(pack.member_path(member) for member in pack.obstacles),
+        _stamps([pack.filename])
+    )
+
+def _build_manifest(name):
+    if theme_pack.is_pack(name):
+        return _build_pack_manifest(name)
+
+    if not path.exists(path.join(SETTINGS_DIR, "themes")):
+        makedirs(path.join(SETTINGS_DIR, "themes"))
+
+    theme_dir = get_theme_dir(name)
+
+    assets = {}
+    for key, val in _ASSET_DICTIONARY.items():
+        val = path.join(theme_dir, val)
+        assets[key] = val if path.isfile(val) else None
+
+    enemies = tuple(sorted(glob(path.join(theme_dir, "images", "enemy*.png"))))
+    obstacles = tuple(sorted(glob(path.join(theme_dir, "images", "obstacle*.png"))))
+
+    return Manifest(
+        theme_dir,
+        MappingProxyType(assets),
+        enemies,
+        obstacles,
+        _stamps(sorted({val for val in assets.values() if val is not None}.union(enemies, obstacles)))
+    )
+
+def get_manifest(name):
+    """Get the manifest of a theme, resolving it on first use"""
+
+    manifest = _manifests.get(name)
+    if manifest is None:
+        manifest = _manifests[name] = _build_manifest(name)
+
+    return manifest
+
+def invalidate(name=None):
+    """Forget a theme, or every theme, so its files are read again
+
+    This drops the manifest along with everything loaded from the
+    theme's files: cached surfaces, open fonts, the HUD digit atlases
+    drawn with them and the mapped pack. Scenes made before keep what
+    they already loaded.
+    """
+
+    hud_text.clear_atlases()
+
+    if name is None:
+        _manifests.clear()
+        surface_cache.get_cache().clear()
+        font_registry.get_registry().clear()
+        theme_pack.forget()
+        return
+
+    manifest = _manifests.pop(name, None)
+    if manifest is None:
+        return
+
+    surface_cache.get_cache().forget(manifest.dir)
+    font_registry.get_registry().forget(manifest.dir)
+    if theme_pack.is_pack(manifest.dir):
+        theme_pack.forget(manifest.dir)
+
+def invalidate_changed():
+    """Forget the themes whose files were added, removed or edited since they were resolved
+
+    Returns the names of the themes forgotten.
+    """
+
+    changed = []
+    for name, manifest in list(_manifests.items()):
+        try:
+            current = _build_manifest(name)
+        except OSError:
+            current = None
+        if current != manifest:
+            # the pack a manifest was read from is forgotten too, so it is
+            # built again from the file as it is now
+            invalidate(name)
+            changed.append(name)
+
+    return changed
 
 class Theme:
 
     def __init__(self, name='default'):
 
-        if not path.exists(path.join(SETTINGS_DIR, "themes")):
-            makedirs(path.join(SETTINGS_DIR, "themes"))
-
         self._name = name
         self._assets_path = path.join(DATA_DIR, "themes", name)
         self._config_path = path.join(SETTINGS_DIR, "themes", name)
 
-        self._asset_dictionary = {
-            "title_icon": path.join("images", "title.png"),
-            "gameover_icon": path.join("images", "gameover.png"),
-            "hero": path.join("images", "hero.png"),
-            "second_hero": path.join("images", "second_hero.png"),
-            "neko": path.join("images", "enemy.png"),
-            "titlefont": path.join("fonts", "title.ttf"),
-            "title_music" : path.join("bgm", "title.ogg"),
-            "leaderboard_music" : path.join("bgm", "leaderboard.ogg"),
-            "gameover_music" : path.join("bgm", "game_over.ogg"),
-            "game_music": path.join("bgm", "game.ogg"),
-            "explosion": path.join("images", "explosion.png"),
-            "explode": path.join("bgs", "explode.ogg"),
-            "explode+kitty": path.join("bgs", "explode+kitty.ogg"),
-            "pixelfont": path.join("fonts", "other.ttf"),
-            "ast1": path.join("images", "asteroid1.png"),
-            "ast2": path.join("images", "asteroid2.png"),
-            "burst": path.join("images", "burst.png"),
-            "playerbullet" : path.join("images", "goodbullet.png"),
-            "enemybullet" : path.join("images", "badbullet.png"),
-            "bg" : path.join("images", "bg.png")
-        }
-
-        self._enemies = []
-        self._obstacles = []
-
-        if path.exists(self._config_path):
-            self._enemies = sorted(glob(path.join(self._config_path, "images", "enemy*.png")))
-            self._obstacles = sorted(glob(path.join(self._config_path, "images", "obstacle*.png")))
-            self._dir = self._config_path
-        elif path.exists(self._assets_path):
-            self._enemies = sorted(glob(path.join(self._assets_path, "images", "enemy*.png")))
-            self._obstacles = sorted(glob(path.join(self._assets_path, "images", "obstacle*.png")))
-            self._dir = self._assets_path
-        else:
-            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), f'{self._config_path} or {self._assets_path}')
+        self._manifest = get_manifest(name)
+        self._dir = self._manifest.dir
+        self._enemies = self._manifest.enemies
+        self._obstacles = self._manifest.obstacles
 
     def get_dir(self):
         return self._dir
 
+    def is_current(self):
+        """Check if the theme still matches the manifest get_manifest resolves"""
+
+        return self._manifest == get_manifest(self._name)
+
     def get_obstacle(self, num):
         if len(self._obstacles) < num:
             return FALLBACK_IMG
@@ -106,12 +224,10 @@ class Theme:
     def get(self, key, fallback):
         """Get an asset at a key"""
 
-        if path.exists(self._config_path):
-            val = self._asset_dictionary.get(key, fallback)
-            val = path.join(self._config_path, val)
-            return val if path.isfile(val) else fallback
+        if key in self._manifest.assets:
+            val = self._manifest.assets[key]
+            return fallback if val is None else val
 
-        val = self._asset_dictionary.get(key, fallback)
-        val = path.join(self._assets_path, val)
+        val = path.join(self._dir, fallback)
 
         return val if path.isfile(val) else fallback
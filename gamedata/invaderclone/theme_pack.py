@@ -0,0 +1,310 @@
+"""Reads and writes single-file theme packs
+
+A pack is one file holding everything a theme directory would:
+
+    magic b"ICPK", u16 version, u16 reserved, u32 header length
+    the header, a UTF-8 JSON index
+    the members, each starting on a 16 byte boundary
+
+The index maps the theme's asset keys, enemies and obstacles to member
+names, and every member name to its length and its offset from the end
+of the padded header.
+
+Images are decoded when the pack is written and stored as raw RGBA
+pixels, their width and height in the index. Loading one wraps the
+mapped bytes with image.frombuffer, so no PNG is ever decoded at run
+time; the SurfaceCache then copies it once into the display format with
+convert_alpha. Sounds, music, fonts and theme.args are stored as they
+are on disk.
+
+An asset inside a pack is named "<pack file>::<member>", which the
+loaders in this module accept anywhere a file name is.
+"""
+
+import io
+import json
+import mmap
+import struct
+import sys
+
+from glob import glob
+from os import path
+
+import pygame
+
+
+MAGIC = b"ICPK"
+VERSION = 3
+EXTENSION = ".icpk"
+SEPARATOR = "::"
+
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGNMENT = 16
+
+_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga")
+
+
+def _padding(length):
+    return -length % _ALIGNMENT
+
+
+def is_pack(name):
+    """check if a theme name or file names a pack"""
+
+    return name.endswith(EXTENSION)
+
+
+def split_member(filename):
+    """split "<pack>::<member>" into (pack, member), or None for plain files"""
+
+    pack_file, sep, member = filename.partition(SEPARATOR)
+
+    return (pack_file, member) if sep else None
+
+
+class ThemePack:
+    """a memory-mapped theme pack"""
+
+    def __init__(self, filename):
+        """map a pack file and read its index"""
+
+        self._filename = path.realpath(filename)
+
+        with open(self._filename, "rb") as pack_file:
+            self._map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, header_length = _PREAMBLE.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self._filename} is not a version {VERSION} theme pack")
+
+        self._view = memoryview(self._map)
+        header = self._view[_PREAMBLE.size:_PREAMBLE.size + header_length]
+        self._index = json.loads(bytes(header).decode("utf-8"))
+        self._members = self._index["members"]
+        self._data_start = _PREAMBLE.size + header_length
+        self._data_start += _padding(self._data_start)
+
+    @property
+    def filename(self):
+        """get the real path of the pack file"""
+
+        return self._filename
+
+    @property
+    def assets(self):
+        """get the member of each asset key the pack has"""
+
+        return self._index["assets"]
+
+    @property
+    def enemies(self):
+        """get the members holding enemy sprites, in order"""
+
+        return self._index["enemies"]
+
+    @property
+    def obstacles(self):
+        """get the members holding obstacle sprites, in order"""
+
+        return self._index["obstacles"]
+
+    def __contains__(self, member):
+        return member in self._members
+
+    def member_path(self, member):
+        """get the name loaders use for a member"""
+
+        return f"{self._filename}{SEPARATOR}{member}"
+
+    def data(self, member):
+        """get a member's bytes as a view into the mapped file"""
+
+        entry = self._members[member]
+        start = self._data_start + entry["offset"]
+
+        return self._view[start:start + entry["length"]]
+
+    def image(self, member):
+        """get a surface whose pixels are the mapped bytes of a member
+
+        The surface points into the mapping, so it must be copied (as
+        convert_alpha does) before it is drawn on.
+        """
+
+        entry = self._members[member]
+        if "size" not in entry:
+            return pygame.image.load(io.BytesIO(self.data(member)), member)
+
+        return pygame.image.frombuffer(self.data(member), entry["size"], "RGBA")
+
+    def open(self, member):
+        """get a file object reading a member"""
+
+        return io.BytesIO(self.data(member))
+
+
+_packs = {}
+
+
+def get_pack(filename):
+    """get the open pack for a file, mapping it on first use
+
+    A pack stays mapped until it is forgotten and nothing made from it,
+    like a surface pointing into the mapping, is left.
+    """
+
+    filename = path.realpath(filename)
+
+    pack = _packs.get(filename)
+    if pack is None:
+        pack = _packs[filename] = ThemePack(filename)
+
+    return pack
+
+
+def forget(filename=None):
+    """forget the pack for a file, or every pack, so it is mapped again on next use"""
+
+    if filename is None:
+        _packs.clear()
+    else:
+        _packs.pop(path.realpath(filename), None)
+
+
+def is_within(filename, directory):
+    """check if a file, or a pack member, is directory or lies inside it
+
+    directory may be a pack file, which holds its members.
+    """
+
+    return (
+        filename == directory
+        or filename.startswith(directory + path.sep)
+        or filename.startswith(directory + SEPARATOR)
+        )
+
+
+def isfile(filename):
+    """check if a file, or a pack member, exists"""
+
+    split = split_member(filename)
+    if split is None:
+        return path.isfile(filename)
+
+    return path.isfile(split[0]) and split[1] in get_pack(split[0])
+
+
+def resolve(filename):
+    """get something pygame can load a file, or a pack member, from"""
+
+    split = split_member(filename)
+    if split is None:
+        return filename
+
+    return get_pack(split[0]).open(split[1])
+
+
+def load_image(filename):
+    """load an image from a file or a pack member"""
+
+    split = split_member(filename)
+    if split is None:
+        return pygame.image.load(filename)
+
+    return get_pack(split[0]).image(split[1])
+
+
+def read_text(filename):
+    """read a text file, or a pack member, whole"""
+
+    split = split_member(filename)
+    if split is None:
+        with open(filename, "r") as text_file:
+            return text_file.read()
+
+    return bytes(get_pack(split[0]).data(split[1])).decode("utf-8")
+
+
+def write_pack(theme_dir, filename, asset_dictionary):
+    """pack a theme directory into a single file
+
+    asset_dictionary maps asset keys to paths inside the theme directory,
+    as Theme uses it. Images are decoded and stored as raw RGBA.
+    """
+
+    assets = {}
+    for key, relpath in asset_dictionary.items():
+        if path.isfile(path.join(theme_dir, relpath)):
+            assets[key] = relpath.replace(path.sep, "/")
+
+    def members_matching(pattern):
+        return [
+            path.relpath(found, theme_dir).replace(path.sep, "/")
+            for found in sorted(glob(path.join(theme_dir, "images", pattern)))
+            ]
+
+    enemies = members_matching("enemy*.png")
+    obstacles = members_matching("obstacle*.png")
+
+    names = sorted(set(assets.values()) | set(enemies) | set(obstacles))
+    if path.isfile(path.join(theme_dir, "theme.args")):
+        names.append("theme.args")
+
+    members = {}
+    blobs = []
+    offset = 0
+    for name in names:
+        source = path.join(theme_dir, *name.split("/"))
+        entry = {}
+
+        if path.splitext(name)[1].lower() in _IMAGE_EXTENSIONS:
+            image = pygame.image.load(source)
+            blob = pygame.image.tobytes(image, "RGBA")
+            entry["size"] = list(image.get_size())
+        else:
+            with open(source, "rb") as source_file:
+                blob = source_file.read()
+
+        entry["offset"] = offset
+        entry["length"] = len(blob)
+        members[name] = entry
+        blobs.append(blob)
+        offset += len(blob) + _padding(len(blob))
+
+    index = {
+        "assets": assets,
+        "enemies": enemies,
+        "obstacles": obstacles,
+        "members": members,
+        }
+
+    header = json.dumps(index, sort_keys=True).encode("utf-8")
+
+    with open(filename, "wb") as pack_file:
+        pack_file.write(_PREAMBLE.pack(MAGIC, VERSION, 0, len(header)))
+        pack_file.write(header)
+        pack_file.write(bytes(_padding(_PREAMBLE.size + len(header))))
+        for blob in blobs:
+            pack_file.write(blob)
+            pack_file.write(bytes(_padding(len(blob))))
+
+
+def main(argv=None):
+    """pack a theme: python -m invaderclone.theme_pack THEME OUTPUT"""
+
+    # pylint: disable=import-outside-toplevel
+    from .theme import get_theme_dir, _ASSET_DICTIONARY
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python -m invaderclone.theme_pack THEME OUTPUT.icpk")
+        return 2
+
+    theme_dir = argv[0] if path.isdir(argv[0]) else get_theme_dir(argv[0])
+    write_pack(theme_dir, argv[1], _ASSET_DICTIONARY)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@
 
 import sys
 import os
+import io
 import argparse
 
 import pygame
@@ -13,10 +14,14 @@ from copy import deepcopy
 from invaderclone.game import InvaderClone
 from invaderclone.rgbcolors import color_dictionary as cd
 from invaderclone.theme import Theme, get_theme_dir
+from invaderclone import theme_pack
+from invaderclone.settings import GameSettings
 
 
-def main():
-    raw_args = deepcopy(sys.argv)
+def parse_game_settings(argv=None):
+    """Turn command line arguments and theme.args into a settings dict"""
+
+    raw_args = sys.argv[1:] if argv is None else list(argv)
 
     colors = [key for key in cd.keys() if key is not None]
 
@@ -34,9 +39,20 @@ def main():
     window_settings.add_argument("--width", default=1000, type=int, help="window width (default 1000)")
     window_settings.add_argument("--height", default=800, type=int, help="window height (default 800)")
     window_settings.add_argument("-n", "--name", default="Invader Clone", help="change the name of the game")
+    window_settings.add_argument("--dirty_rects", action="store_true", help="only update the parts of the window that changed (needs --disable_stars and no background)")
+    window_settings.add_argument("--headless", action="store_true", help="run without a window or sound, as fast as possible")
+    window_settings.add_argument("--skip_draw", action="store_true", help="never draw scenes, only update them")
+    window_settings.add_argument("--perf_hud", action="store_true", help="start with the frame time overlay shown (F3 toggles it)")
 
     game_settings = parser.add_argument_group(title="game settings", description="modify core game functionality")
-    game_settings.add_argument("--frame_rate", default=60, type=int, help="game frame rate")
+    game_settings.add_argument("--frame_rate", default=60, type=int, help="most frames drawn per second, or 0 for no limit")
+    game_settings.add_argument("--tick_rate", default=60, type=int, help="game updates per second, which sets the game speed")
+    game_settings.add_argument("--max_ticks", default=0, type=int, help="quit after this many game updates, or 0 to play until quit")
+    game_settings.add_argument("--start_scene", default="PolygonTitleScene", help="scene to start the game in, such as Level0")
+    game_settings.add_argument("--seed", default=None, type=int, help="seed the random numbers so a game can be played the same way again")
+    game_settings.add_argument("--record", default=None, metavar="FILE", help="record the game's input to a replay file")
+    game_settings.add_argument("--replay", default=None, metavar="FILE", help="play back a replay file instead of reading input")
+    game_settings.add_argument("--replay_speed", default=1., type=float, help="how many times faster than real time to play a replay, or 0 for as fast as possible")
     game_settings.add_argument("--disable_gamepads", action="store_true", help="disable the use of gamepads (if for some reason it doesn't work)")
     game_settings.add_argument("--disable_multiplayer", action="store_true", help="disable multiplayer functionality")
 
@@ -63,7 +79,7 @@ def main():
     difficulty_settings.add_argument("--death_penalty", type=int, default=100, help="how many points are taken from the player for dying.")
 
     theme_settings = parser.add_argument_group(title="theme settings", description="modify generic theme settings")
-    theme_settings.add_argument("-t", "--theme", default="default", help="change the theme of the game.")
+    theme_settings.add_argument("-t", "--theme", default="default", help="change the theme of the game. a path to a .icpk theme pack loads the pack.")
     theme_settings.add_argument("-s", "--disable_stars", action='store_true', help='disable parallax stars effect')
     theme_settings.add_argument("-b", "--enable_background", action='store_true', help='enable a parallax bg effect')
     theme_settings.add_argument("--bg_speed", type=int, default=6, help='background scroll speed')
@@ -102,7 +118,7 @@ def main():
     advanced_settings.add_argument("--set_custom_keys", nargs="+", default=[], help="add dictionary entries to the game settings entries as k:v pairs. seperate with spaces")
     advanced_settings.add_argument("--add_custom_assets", nargs="+", default=[], help="add custom assets to the game as k:v pairs. seperate with spaces")
 
-    args = parser.parse_args()
+    args = parser.parse_args(raw_args)
 
     # check if correct sound assets are being applied to sound settings:
 
@@ -162,15 +178,17 @@ def main():
                 )
 
     theme_args = os.path.join(theme_dir, "theme.args")
+    if theme_pack.is_pack(args.theme):
+        theme_args = f"{get_theme_dir(args.theme)}{theme_pack.SEPARATOR}theme.args"
     default_args = os.path.join(os.getcwd(), "default.args")
 
-    if os.path.isfile(theme_args) or (args.theme == "default" and os.path.isfile(default_args)):
+    if theme_pack.isfile(theme_args) or (args.theme == "default" and os.path.isfile(default_args)):
         var_args = vars(args)
         var_args_keys = var_args.keys()
 
         args_file = theme_args if not args.theme =="default" else default_args
 
-        with open(args_file, "r") as theme_args:
+        with io.StringIO(theme_pack.read_text(args_file)) as theme_args:
             lines = theme_args.readlines()
 
             for num, line in enumerate(lines):
@@ -229,7 +247,7 @@ def main():
                             )
                         sys.exit(-1)
 
-    game_settings = deepcopy(dict(vars(args)))
+    game_settings = GameSettings(deepcopy(vars(args)))
 
     controls = {
         "up_keys" : [pygame.K_UP, pygame.K_a],
@@ -263,7 +281,11 @@ def main():
         else:
             print(f"Ignoring key with name: {setting}, already exists!")
 
-    sys.exit(InvaderClone(game_settings).run())
+    return game_settings
+
+
+def main():
+    sys.exit(InvaderClone(parse_game_settings()).run())
 
 
 if __name__ == "__main__":
@@ -16,14 +16,15 @@ setup(
     packages=["invaderclone"],
     author="Zachary Worcester",
     author_email="zworcester0@csu.fullerton.edu",
-    install_requires=["pygame"],
+    install_requires=["pygame", "numpy"],
     url="https://github.com/ganelonhb/invaderclone",
     py_modules = ["invaders"],
     package_data = {"invaderclone" : ["data/*", "data/themes/default/bgm/*", "data/themes/default/bgs/*", "data/themes/default/fonts/*", "data/themes/default/images/*"]},
     include_package_data=True,
     entry_points= {
         'console_scripts' : [
-            'invaderclone = invaders:main'
+            'invaderclone = invaders:main',
+            'invaderclone-bench = invaderclone.benchmark:main'
             ]
         }
     )
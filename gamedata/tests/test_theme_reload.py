@@ -0,0 +1,74 @@
+"""Restarting the levels picks up a theme edited in place"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# keep scores and custom levels out of the real settings directory
+os.environ["HOME"] = tempfile.mkdtemp(prefix="invaderclone-home-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+# pylint: disable=import-error wrong-import-position
+from invaders import parse_game_settings
+from invaderclone.constants import DATA_DIR
+from invaderclone.game import InvaderClone
+
+
+EDITED_COLOR = pygame.Color(255, 0, 255)
+
+
+def _count_pixels(surface, color):
+    """count the pixels of surface that are color"""
+
+    return pygame.mask.from_threshold(surface, color, (1, 1, 1, 255)).count()
+
+
+def _draw_level(game):
+    """start Level0 as the game would and draw one frame of it"""
+
+    # pylint: disable=protected-access
+    level = game._scene_dict["Level0"]
+    level.start_scene()
+    level.update_settings()
+    level.draw()
+
+    return level
+
+
+def test_restart_sees_image_edited_in_place(tmp_path):
+    theme_dir = tmp_path / "edited"
+    shutil.copytree(os.path.join(DATA_DIR, "themes", "default"), theme_dir)
+
+    game = InvaderClone(parse_game_settings(["--headless", "--theme", str(theme_dir), "--seed", "0"]))
+    screen = pygame.display.get_surface()
+
+    first = _draw_level(game)
+    assert _count_pixels(screen, EDITED_COLOR) == 0
+
+    hero_file = theme_dir / "images" / "hero.png"
+    hero = pygame.image.load(str(hero_file))
+    hero.fill(EDITED_COLOR)
+    pygame.image.save(hero, str(hero_file))
+
+    game.reinitialize_levels()
+
+    restarted = _draw_level(game)
+    assert restarted is not first
+    assert _count_pixels(screen, EDITED_COLOR) > 0
+
+
+def test_restart_keeps_unchanged_level(tmp_path):
+    theme_dir = tmp_path / "unchanged"
+    shutil.copytree(os.path.join(DATA_DIR, "themes", "default"), theme_dir)
+
+    game = InvaderClone(parse_game_settings(["--headless", "--theme", str(theme_dir), "--seed", "0"]))
+
+    first = _draw_level(game)
+    game.reinitialize_levels()
+
+    assert _draw_level(game) is first